@@ -1,3 +1,5 @@
+import functools
+import platform
 import tkinter as tk
 from tkinter import messagebox, colorchooser
 from src.config import ConfigManager, THEME, APP_NAME, VERSION
@@ -10,11 +12,60 @@ from src.logic.processor import TextProcessor
 from src.logic.formatting import FormatManager
 from src.logic.tools import ToolManager
 
+IS_MACOS = platform.system() == "Darwin"
+CTRL_KEY = "Command" if IS_MACOS else "Control"
+
 
 class App:
+    # Ribbon commands: (key, owner attribute or None for the App, method, bound args)
+    _CALLBACK_SPECS = (
+        ('open', 'file_mgr', 'open_file', ()),
+        ('save', 'file_mgr', 'save_file', ()),
+        ('undo', None, 'safe_undo', ()),
+        ('redo', None, 'safe_redo', ()),
+        ('bold', 'formatter', 'toggle_format', ('bold',)),
+        ('italic', 'formatter', 'toggle_format', ('italic',)),
+        ('underline', 'formatter', 'toggle_format', ('underline',)),
+        ('strike', 'formatter', 'toggle_format', ('overstrike',)),
+        ('align_l', 'formatter', 'set_alignment', ('left',)),
+        ('align_c', 'formatter', 'set_alignment', ('center',)),
+        ('align_r', 'formatter', 'set_alignment', ('right',)),
+
+        # Lists
+        ('list', 'formatter', 'toggle_list', ()),
+        ('num_list', 'formatter', 'toggle_numbered_list', ()),
+
+        ('color', 'formatter', 'pick_text_color', ()),
+        ('highlight', 'formatter', 'apply_highlight', ()),
+        ('clear_fmt', 'formatter', 'clear_formatting', ()),
+        ('spacing', 'formatter', 'set_line_spacing', ()),
+        ('font_fam', 'formatter', 'apply_font_family', ()),
+        ('font_size', 'formatter', 'apply_font_size', ()),
+        ('zoom_in', None, 'update_zoom', (10,)),
+        ('zoom_out', None, 'update_zoom', (-10,)),
+        ('img', 'tools', 'insert_image', ()),
+        ('hr_line', 'tools', 'insert_horizontal_line', ()),
+        ('date', 'tools', 'insert_date_time', ()),
+        ('symbol', 'tools', 'open_symbol_picker', ()),
+        ('find', 'tools', 'open_find_replace', ()),
+        ('stats', 'tools', 'show_stats', ()),
+        ('pdf', 'file_mgr', 'export_pdf', ()),
+        ('select_all', 'tools', 'select_all', ()),
+
+        # Review
+        ('spell', 'processor', 'run_spell_check', ()),
+        ('tts', 'processor', 'read_aloud', ()),
+
+        # View tab
+        ('pg_color', None, 'pick_paper_color', ()),
+        ('theme', None, 'toggle_theme', ()),
+        ('focus', None, 'toggle_focus_mode', ()),
+        ('sidebar', None, 'toggle_sidebar', ()),
+    )
+
     def __init__(self, root):
         self.root = root
-        self.config_mgr = ConfigManager()
+        self.config_mgr = ConfigManager(self.root)
         self.settings = self.config_mgr.data
 
         self.root.title(f"{APP_NAME} {VERSION}")
@@ -26,14 +77,17 @@ class App:
         self.sidebar_visible = bool(self.settings.get("sidebar_visible", True))
         self.focus_mode = bool(self.settings.get("focus_mode", False))
 
+        # Pending after() id for the throttled <<Modified>> handler
+        self._modified_after = None
+
         self.colors = THEME[self.current_theme]
 
         # Layout
-        self.main_container = tk.Frame(self.root, bg=self.colors["bg"])
+        self.main_container = tk.Frame(self.root, bg=self.colors.bg)
         self.main_container.pack(fill=tk.BOTH, expand=True)
 
         # Content area (sidebar + workspace)
-        self.content = tk.Frame(self.main_container, bg=self.colors["bg"])
+        self.content = tk.Frame(self.main_container, bg=self.colors.bg)
         self.content.pack(fill=tk.BOTH, expand=True)
 
         # Sidebar + workspace (we control packing/visibility here)
@@ -44,72 +98,35 @@ class App:
         # Workspace packs itself in its __init__; undo that so we can lay out properly
         try:
             self.workspace.pack_forget()
-        except Exception:
+        except tk.TclError:
             pass
+        # What is currently packed, so layout changes only touch what differs
+        self._sidebar_packed = False
+        self._workspace_packed = False
 
         # Logic Modules
         self.file_mgr = FileManager(self.editor, self.root)
         self.formatter = FormatManager(self.editor, self.root)
+        # Loaded documents bring their own style tags; let the formatter track them.
+        self.file_mgr.on_load = self.formatter.adopt_style_tags
         self.tools = ToolManager(self.editor, self.root)
         self.processor = TextProcessor(self.editor)
 
         # Statusbar
         self.statusbar = StatusBar(self.root, self, self.colors)
+        self._statusbar_packed = True  # StatusBar packs itself
 
         # Apply stored paper color override (if any)
         if self.paper_color:
             try:
                 self.editor.config(bg=self.paper_color)
-            except Exception:
+            except tk.TclError:
                 pass
 
-        # Commands
-        callbacks = {
-            'open': self.file_mgr.open_file,
-            'save': self.file_mgr.save_file,
-            'undo': self.safe_undo,
-            'redo': self.safe_redo,
-            'bold': lambda: self.formatter.toggle_format('bold'),
-            'italic': lambda: self.formatter.toggle_format('italic'),
-            'underline': lambda: self.formatter.toggle_format('underline'),
-            'strike': lambda: self.formatter.toggle_format('overstrike'),
-            'align_l': lambda: self.formatter.set_alignment('left'),
-            'align_c': lambda: self.formatter.set_alignment('center'),
-            'align_r': lambda: self.formatter.set_alignment('right'),
-
-            # Lists
-            'list': self.formatter.toggle_list,
-            'num_list': self.formatter.toggle_numbered_list,
-
-            'color': self.formatter.pick_text_color,
-            'highlight': self.formatter.apply_highlight,
-            'clear_fmt': self.formatter.clear_formatting,
-            'spacing': self.formatter.set_line_spacing,
-            'font_fam': self.formatter.apply_font_family,
-            'font_size': self.formatter.apply_font_size,
-            'zoom_in': lambda: self.update_zoom(10),
-            'zoom_out': lambda: self.update_zoom(-10),
-            'img': self.tools.insert_image,
-            'hr_line': self.tools.insert_horizontal_line,
-            'date': self.tools.insert_date_time,
-            'symbol': self.tools.open_symbol_picker,
-            'find': self.tools.open_find_replace,
-            'stats': self.tools.show_stats,
-            'pdf': self.file_mgr.export_pdf,
-            'select_all': self.tools.select_all,
-
-            # Review (now wired)
-            'spell': self.processor.run_spell_check,
-            'tts': self.processor.read_aloud,
-
-            # View tab
-            'pg_color': self.pick_paper_color,
-            'theme': self.toggle_theme,
-            'focus': self.toggle_focus_mode,
-            'sidebar': self.toggle_sidebar,
-        }
-
-        self.ribbon = Ribbon(self.root, callbacks, self.colors)
+        # Commands (built once; the ribbon and shortcuts share these callables)
+        self._callbacks = self._build_callbacks()
+
+        self.ribbon = Ribbon(self.root, self._callbacks, self.colors)
         self.ribbon.pack(side=tk.TOP, fill=tk.X, before=self.main_container)
 
         self._bind_shortcuts()
@@ -124,6 +141,21 @@ class App:
         if self.focus_mode:
             self._apply_focus_state(True)
 
+        # Config saves are debounced; make sure a pending one lands before exit.
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        self.config_mgr.flush()
+        self.root.destroy()
+
+    def _build_callbacks(self):
+        # Bind each command once up front instead of wrapping it in a lambda.
+        callbacks = {}
+        for key, owner, name, args in self._CALLBACK_SPECS:
+            fn = getattr(getattr(self, owner) if owner else self, name)
+            callbacks[key] = functools.partial(fn, *args) if args else fn
+        return callbacks
+
     # -----------------------------
     # View Tab Features
     # -----------------------------
@@ -150,13 +182,13 @@ class App:
         # Apply directly to the editor "paper"
         try:
             self.editor.config(bg=hex_color)
-        except Exception:
+        except tk.TclError:
             pass
 
-        # Sidebar tree uses colors["paper"], so refresh theme so it matches better
+        # Sidebar tree uses colors.paper, so refresh theme so it matches better
         try:
             self.sidebar.update_theme(self.colors)
-        except Exception:
+        except tk.TclError:
             pass
 
     def toggle_sidebar(self):
@@ -181,91 +213,89 @@ class App:
     def _apply_focus_state(self, enabled: bool):
         if enabled:
             # Hide sidebar + statusbar for distraction-free mode
-            try:
-                self.sidebar.frame.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.statusbar.frame.pack_forget()
-            except Exception:
-                pass
+            self._set_sidebar_packed(False)
+            if self._statusbar_packed:
+                try:
+                    self.statusbar.frame.pack_forget()
+                    self._statusbar_packed = False
+                except tk.TclError:
+                    pass
             # Keep workspace visible
             self._pack_workspace_only()
         else:
             # Restore statusbar and sidebar based on saved sidebar_visible
-            try:
-                self.statusbar.frame.pack(side=tk.BOTTOM, fill=tk.X)
-            except Exception:
-                pass
+            if not self._statusbar_packed:
+                try:
+                    self.statusbar.frame.pack(side=tk.BOTTOM, fill=tk.X, before=self.main_container)
+                    self._statusbar_packed = True
+                except tk.TclError:
+                    pass
             self._apply_layout_state()
 
     def _apply_layout_state(self):
-        # Always clear current packing first
-        try:
-            self.sidebar.frame.pack_forget()
-        except Exception:
-            pass
-        try:
-            self.workspace.pack_forget()
-        except Exception:
-            pass
-
-        if self.sidebar_visible:
-            # Sidebar on the left
-            self.sidebar.frame.pack(side=tk.LEFT, fill=tk.Y)
+        # Only pack/unpack what actually changes; each call re-negotiates the
+        # container's geometry.
+        self._set_sidebar_packed(self.sidebar_visible)
 
         # Workspace consumes the rest
-        self.workspace.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._pack_workspace_only()
 
-    def _pack_workspace_only(self):
+    def _set_sidebar_packed(self, packed):
+        if packed == self._sidebar_packed:
+            return
         try:
-            self.workspace.pack_forget()
-        except Exception:
+            if packed:
+                # Sidebar on the left, ahead of the workspace if that is already packed
+                opts = {"before": self.workspace} if self._workspace_packed else {}
+                self.sidebar.frame.pack(side=tk.LEFT, fill=tk.Y, **opts)
+            else:
+                self.sidebar.frame.pack_forget()
+            self._sidebar_packed = packed
+        except tk.TclError:
             pass
-        self.workspace.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def _pack_workspace_only(self):
+        if not self._workspace_packed:
+            self.workspace.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self._workspace_packed = True
 
     def apply_theme(self):
         # Update background frames
         try:
-            self.main_container.config(bg=self.colors["bg"])
-            self.content.config(bg=self.colors["bg"])
-        except Exception:
+            self.main_container.config(bg=self.colors.bg)
+            self.content.config(bg=self.colors.bg)
+        except tk.TclError:
             pass
 
-        # Push theme into components
-        try:
-            self.ribbon.update_theme(self.colors)
-        except Exception:
-            pass
-        try:
-            self.workspace.update_theme(self.colors)
-        except Exception:
-            pass
-        try:
-            self.sidebar.update_theme(self.colors)
-        except Exception:
-            pass
-        try:
-            self.statusbar.update_theme(self.colors)
-        except Exception:
-            pass
+        # Push theme into components. These only queue configure changes; Tk
+        # repaints once at idle, which we trigger explicitly below.
+        for component in (self.ribbon, self.workspace, self.sidebar, self.statusbar):
+            try:
+                component.update_theme(self.colors)
+            except tk.TclError:
+                pass
 
         # Re-apply paper override after theme swap
         if self.paper_color:
             try:
                 self.editor.config(bg=self.paper_color)
-            except Exception:
+            except tk.TclError:
                 pass
 
+        # Flush geometry/redraw for the whole swap in a single pass.
+        self.root.update_idletasks()
+
     # -----------------------------
     # Undo/Redo (safe versions)
     # -----------------------------
 
     def safe_undo(self):
+        # Settle pending text activity first so undo picks the right stack.
+        self._flush_modified()
         try:
             if self.formatter.undo_format():
                 return
-        except Exception:
+        except tk.TclError:
             pass
         try:
             self.editor.edit_undo()
@@ -274,17 +304,20 @@ class App:
             pass
 
     def safe_redo(self):
+        self._flush_modified()
         try:
             if self.formatter.redo_format():
                 return
-        except Exception:
+        except tk.TclError:
             pass
         try:
             self.editor.edit_redo()
         except tk.TclError:
             pass
 
-    def update_zoom(self, amount=0, absolute=None):
+    def update_zoom(self, amount=0, absolute=None, persist=True):
+        # persist=False is for intermediate ticks (slider drag): redraw only,
+        # no per-style retagging and no config write.
         current = self.formatter.zoom_level
         new_zoom = absolute if absolute else current + amount
 
@@ -293,25 +326,35 @@ class App:
         if new_zoom > 200:
             new_zoom = 200
 
-        self.formatter.set_zoom(new_zoom)
+        self.formatter.set_zoom(new_zoom, apply_tags=persist)
         self.statusbar.update_zoom_label(new_zoom)
-        self.settings["zoom"] = new_zoom
-        self.config_mgr.save()
+        if persist:
+            self.settings["zoom"] = new_zoom
+            self.config_mgr.save()
+
+    def _on_modified(self, _evt=None):
+        # <<Modified>> fires on every edit; coalesce bursts into one check.
+        if self._modified_after is None:
+            self._modified_after = self.root.after(50, self._flush_modified)
+
+    def _flush_modified(self):
+        if self._modified_after is not None:
+            self.root.after_cancel(self._modified_after)
+            self._modified_after = None
+        try:
+            if self.editor.edit_modified():
+                self.formatter.note_text_activity()
+                self.editor.edit_modified(False)
+        except tk.TclError:
+            pass
 
     def _bind_shortcuts(self):
-        self.root.bind("<Control-s>", lambda e: self.file_mgr.save_file())
-        self.root.bind("<Control-z>", lambda e: self.safe_undo())
-        self.root.bind("<Control-y>", lambda e: self.safe_redo())
-
-        def _on_modified(_evt):
-            try:
-                if self.editor.edit_modified():
-                    self.formatter.note_text_activity()
-                    self.editor.edit_modified(False)
-            except Exception:
-                pass
+        # Bind only the platform's primary modifier (Command on macOS).
+        for key, name in (("s", "save"), ("z", "undo"), ("y", "redo")):
+            cb = self._callbacks[name]
+            self.root.bind(f"<{CTRL_KEY}-{key}>", lambda e, cb=cb: cb())
 
-        self.editor.bind("<<Modified>>", _on_modified, add="+")
+        self.editor.bind("<<Modified>>", self._on_modified, add="+")
 
         # List continuation (bullets + numbering)
         self.editor.bind("<Return>", self.formatter.handle_return_key, add="+")
@@ -1,30 +1,73 @@
 import json, os
+from collections import OrderedDict, namedtuple
+
+try:
+    import orjson  # optional, faster (de)serialization
+except ImportError:
+    orjson = None
 
 APP_NAME = "PyWord Pro"
 VERSION = "5.0 Modular"
 CONFIG_FILE = "pyword_config.json"
+SAVE_DELAY_MS = 500
+MAX_RECENTS = 8
+
+# Immutable palette; components read colors as attributes (c.bg, c.text, ...).
+ThemeColors = namedtuple("ThemeColors", "ribbon bg paper text ruler sidebar primary console")
 
 THEME = {
-    "light": {"ribbon": "#f3f3f3", "bg": "#e6e6e6", "paper": "#ffffff", "text": "#2d2d2d", "ruler": "#fcfcfc", "sidebar": "#f9f9f9", "primary": "#2b579a", "console": "#f0f0f0"},
-    "dark": {"ribbon": "#2d2d2d", "bg": "#1e1e1e", "paper": "#3c3c3c", "text": "#e0e0e0", "ruler": "#333333", "sidebar": "#252526", "primary": "#007acc", "console": "#252526"}
+    "light": ThemeColors(ribbon="#f3f3f3", bg="#e6e6e6", paper="#ffffff", text="#2d2d2d", ruler="#fcfcfc", sidebar="#f9f9f9", primary="#2b579a", console="#f0f0f0"),
+    "dark": ThemeColors(ribbon="#2d2d2d", bg="#1e1e1e", paper="#3c3c3c", text="#e0e0e0", ruler="#333333", sidebar="#252526", primary="#007acc", console="#252526")
 }
 
 class ConfigManager:
-    def __init__(self):
+    def __init__(self, root=None):
+        # With a Tk root, save() is debounced through root.after; without one it writes immediately.
+        self.root = root
         self.defaults = {"theme": "light", "recents": [], "geometry": "1600x1000", "zoom": 100}
         self.data = self.load()
+        # Most-recent-last; mirrored into data["recents"] (most-recent-first) for saving.
+        self._recents = OrderedDict.fromkeys(reversed(self.data.get("recents", [])))
+        self._dirty = False
+        self._save_after_id = None
+        self._last_serialized = self._serialize() if os.path.exists(CONFIG_FILE) else None
     def load(self):
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, "r") as f: return json.load(f)
-            except: pass
+                with open(CONFIG_FILE, "rb") as f: raw = f.read()
+                return orjson.loads(raw) if orjson else json.loads(raw)
+            except (OSError, ValueError): pass
         return self.defaults.copy()
+    def _serialize(self):
+        if orjson: return orjson.dumps(self.data)
+        return json.dumps(self.data, separators=(",", ":")).encode("utf-8")
     def save(self):
+        """Queue a write; bursts of calls within SAVE_DELAY_MS coalesce into one."""
+        self._dirty = True
+        if self.root is None:
+            self.flush()
+            return
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SAVE_DELAY_MS, self.flush)
+    def flush(self):
+        """Write pending changes now, skipping the write if nothing changed on disk."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if not self._dirty: return
+        self._dirty = False
+        payload = self._serialize()
+        if payload == self._last_serialized: return
+        tmp = CONFIG_FILE + ".tmp"
         try:
-            with open(CONFIG_FILE, "w") as f: json.dump(self.data, f)
-        except: pass
+            with open(tmp, "wb") as f: f.write(payload)
+            os.replace(tmp, CONFIG_FILE)
+            self._last_serialized = payload
+        except OSError: pass
     def add_recent(self, path):
-        if path in self.data["recents"]: self.data["recents"].remove(path)
-        self.data["recents"].insert(0, path)
-        self.data["recents"] = self.data["recents"][:8]
+        self._recents.pop(path, None)
+        self._recents[path] = None
+        while len(self._recents) > MAX_RECENTS: self._recents.popitem(last=False)
+        self.data["recents"] = list(reversed(self._recents))
         self.save()
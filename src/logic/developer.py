@@ -1,25 +1,243 @@
-import sys, subprocess, threading, queue, tkinter as tk
+import os, sys, codecs, subprocess, threading, queue, tkinter as tk
+
+# On Unix Tk can watch the worker's pipes directly; Windows can't register
+# anonymous pipes with createfilehandler, so it keeps the reader-thread + polling path.
+USE_FILEHANDLER = os.name == "posix"
+
+# Marks the end of one run on each of the worker's output streams.
+SENTINEL = "\x00END\x00"
+
+# Long-lived child interpreter. Protocol: "<n>\n" then n bytes of UTF-8 code on
+# stdin; each snippet runs in a fresh __main__ module, after which the sentinel
+# is written to stderr and then stdout. The protocol pipe and the sentinel
+# writes use private fds, so snippets that read stdin, rebind or close
+# sys.stdout/sys.stderr, or call sys.exit() can't stall the worker. The cwd,
+# environment, sys.path and any modules a snippet imported are reset after
+# each run, so one run can't change what the next one sees.
+_WORKER_SRC = r'''
+import os, sys, traceback
+SENTINEL = b"\x00END\x00\n"
+
+def _emit(fd, data):
+    while data:
+        data = data[os.write(fd, data):]
+
+def _serve():
+    proto = os.fdopen(os.dup(0), "rb")
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+    out, err = os.dup(1), os.dup(2)
+    streams = sys.stdin, sys.stdout, sys.stderr
+    cwd, path, environ, modules = os.getcwd(), list(sys.path), dict(os.environ), set(sys.modules)
+    while True:
+        header = proto.readline()
+        if not header:
+            return
+        code = proto.read(int(header)).decode("utf-8")
+        # Not this module: `import __main__` must not reach the worker's own names.
+        main = type(sys)("__main__")
+        sys.modules["__main__"] = main
+        report = None
+        try:
+            exec(compile(code, "<run>", "exec"), main.__dict__)
+        except SystemExit as e:
+            # Like a script run: sys.exit() is quiet unless given a message.
+            if e.code is not None and not isinstance(e.code, int):
+                report = f"{e.code}\n"
+        except BaseException as e:
+            # Start the traceback at the snippet, not at the exec() above.
+            report = "".join(traceback.format_exception(type(e), e, e.__traceback__.tb_next))
+        for stream in (sys.stdout, sys.stderr, *streams[1:]):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        # A snippet that closed the real fds or streams gets fresh ones for later runs.
+        for fd, private in ((1, out), (2, err)):
+            os.dup2(private, fd)
+            if streams[fd].closed:
+                streams = tuple(
+                    os.fdopen(fd, "w", encoding="utf-8", errors="backslashreplace", buffering=1, closefd=False)
+                    if i == fd else st for i, st in enumerate(streams))
+        sys.stdin, sys.stdout, sys.stderr = streams
+        sys.__stdout__, sys.__stderr__ = streams[1:]
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+        os.environ.clear()
+        os.environ.update(environ)
+        sys.path[:] = path
+        # Dropping new modules also discards any the snippet patched (json.dumps = ...).
+        for name in set(sys.modules) - modules:
+            del sys.modules[name]
+        # Free the snippet's globals before the next run.
+        sys.modules["__main__"] = main = None
+        if report:
+            _emit(err, report.encode("utf-8", "replace"))
+        _emit(err, SENTINEL)
+        _emit(out, SENTINEL)
+
+_serve()
+'''
 
 class DeveloperEngine:
+    # Max queued chunks written to the console per tick.
+    BATCH_LIMIT = 200
+    # Worker streams, each with the prefix shown on its console lines.
+    _STREAMS = (("stdout", ""), ("stderr", "Error: "))
+
     def __init__(self, app):
         self.app = app
-        self.console_queue = queue.Queue()
+        self.console_queue = queue.SimpleQueue()
         self.console_widget = None
-        self._console_loop()
+        # The console is only polled while a run is in flight.
+        self._poll_id = None
+        # Warm interpreter shared by all runs; spawned on first use and replaced
+        # when it dies or Run is pressed while it is still busy.
+        self._worker = None
+        # Bumped whenever a worker is stopped, so its leftover output is ignored.
+        self._generation = 0
+        self._busy = False
+        # Streams that sent the current run's sentinel / that reached EOF
+        self._ended = set()
+        self._closed = set()
+        self._fds = []
 
     def run_threaded(self):
         code = self.app.workspace.editor.get("1.0", tk.END)
+        if self._busy:
+            # The last snippet is still running (or stuck): start over in a fresh interpreter.
+            self._stop_worker()
+            self.write_console(">>> Previous run stopped.\n")
         self.write_console(">>> Running...\n")
-        threading.Thread(target=self._exec, args=(code,), daemon=True).start()
+        if not self._submit(code):
+            return
+        self._ended.clear()
+        self._busy = True
+        if not USE_FILEHANDLER and self._poll_id is None:
+            self._poll_id = self.app.root.after(100, self._console_loop)
+
+    def _submit(self, code):
+        """Send code to the worker, replacing one that has died; False on failure."""
+        for retry in (True, False):
+            if self._worker is not None and self._worker.poll() is not None:
+                self._stop_worker()
+            fresh = self._worker is None
+            try:
+                if fresh:
+                    self._start_worker()
+                # The worker is idle between runs, so it drains this write straight away.
+                self._send(self._worker, code)
+                return True
+            except (OSError, ValueError) as e:
+                # OSError: interpreter could not be spawned or its stdin pipe broke
+                self._stop_worker()
+                if fresh or not retry:
+                    self.write_console(str(e) + "\n")
+                    return False
+
+    def _start_worker(self):
+        env = dict(os.environ, PYTHONIOENCODING="utf-8")
+        self._worker = subprocess.Popen(
+            [sys.executable, "-u", "-c", _WORKER_SRC],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", bufsize=1, env=env)
+        self._closed.clear()
+        for name, prefix in self._STREAMS:
+            stream = getattr(self._worker, name)
+            if USE_FILEHANDLER:
+                self._watch(stream, name, prefix)
+            else:
+                threading.Thread(target=self._pump, args=(stream, name, prefix, self._generation), daemon=True).start()
+
+    def _stop_worker(self):
+        """Kill the worker, if any, and forget its run and output."""
+        worker, self._worker = self._worker, None
+        self._busy = False
+        self._generation += 1
+        for fd in self._fds:
+            self.app.root.tk.deletefilehandler(fd)
+        self._fds.clear()
+        if worker is None: return
+        if worker.poll() is None:
+            worker.kill()
+        worker.wait()
+        # Reader threads close their own streams.
+        for pipe in (worker.stdin, worker.stdout, worker.stderr) if USE_FILEHANDLER else (worker.stdin,):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _send(worker, code):
+        # Bytes, not text: the length prefix counts bytes and must not see newline translation.
+        data = code.encode("utf-8")
+        worker.stdin.buffer.write(b"%d\n%s" % (len(data), data))
+        worker.stdin.buffer.flush()
+
+    def _on_output(self, name, prefix, lines, eof=False):
+        """Handle complete lines (and EOF) from one worker stream; returns the console text."""
+        out = []
+        for line in lines:
+            if SENTINEL in line:
+                head = line.split(SENTINEL, 1)[0]
+                if head: out.append(prefix + head + "\n")
+                self._ended.add(name)
+            else:
+                out.append(prefix + line)
+        if self._busy and len(self._ended) == len(self._STREAMS):
+            self._busy = False
+        if eof:
+            self._closed.add(name)
+            if len(self._closed) == len(self._STREAMS):
+                # Both pipes are closed, so the worker itself has exited.
+                self._stop_worker()
+                out.append("Worker exited; a fresh interpreter will start on the next run.\n")
+        return "".join(out)
+
+    # --- Unix: Tk wakes us when the worker writes, no polling ---
+
+    def _watch(self, stream, name, prefix):
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        partial = [""]
+
+        def on_readable(_fd, _mask):
+            try:
+                data = os.read(fd, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""
+            if not data:
+                # At EOF the fd stays readable; stop watching it.
+                self.app.root.tk.deletefilehandler(fd)
+                self._fds.remove(fd)
+            lines = (partial[0] + decoder.decode(data, final=not data)).splitlines(True)
+            # Hold back an unterminated last line until more output (or EOF) arrives.
+            partial[0] = lines.pop() if data and lines and not lines[-1].endswith("\n") else ""
+            text = self._on_output(name, prefix, lines, eof=not data)
+            if text: self.write_console(text)
+
+        self._fds.append(fd)
+        self.app.root.tk.createfilehandler(fd, tk.READABLE, on_readable)
+
+    # --- Windows: reader threads feed console_queue, drained by _console_loop ---
 
-    def _exec(self, code):
+    def _pump(self, stream, name, prefix, generation):
+        # Forward output line by line so the console updates while the script runs.
         try:
-            process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            out, err = process.communicate()
-            self.console_queue.put(out + "\n")
-            if err: self.console_queue.put(f"Error:\n{err}\n")
-        except Exception as e:
-            self.console_queue.put(str(e))
+            with stream:
+                for line in stream:
+                    self.console_queue.put((generation, name, prefix, line))
+        except (OSError, ValueError):
+            pass
+        # None marks EOF: the worker has exited or was stopped.
+        self.console_queue.put((generation, name, prefix, None))
 
     def write_console(self, text):
         if self.console_widget:
@@ -29,8 +247,18 @@ class DeveloperEngine:
             self.console_widget.config(state='disabled')
 
     def _console_loop(self):
+        self._poll_id = None
+        batch = []
         try:
-            while not self.console_queue.empty():
-                self.write_console(self.console_queue.get_nowait())
-        except: pass
-        self.app.root.after(100, self._console_loop)
+            while len(batch) < self.BATCH_LIMIT:
+                batch.append(self.console_queue.get_nowait())
+        except queue.Empty: pass
+        out = []
+        for generation, name, prefix, line in batch:
+            # Output from a stopped worker is dropped.
+            if generation == self._generation:
+                out.append(self._on_output(name, prefix, [] if line is None else [line], eof=line is None))
+        text = "".join(out)
+        if text: self.write_console(text)
+        if self._busy or not self.console_queue.empty():
+            self._poll_id = self.app.root.after(100, self._console_loop)
@@ -1,34 +1,88 @@
 import os
 import re
-import hashlib
+import shutil
+import functools
+import importlib.util
+import threading
+from concurrent.futures import Future
+from collections import defaultdict
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import font as tkfont
 
-try:
-    from docx import Document
-    HAS_DOCX = True
-except ImportError:
-    HAS_DOCX = False
-
-if HAS_DOCX:
-    try:
-        from docx.shared import Pt, RGBColor
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.enum.text import WD_COLOR_INDEX
-    except Exception:
-        Pt = None
-        RGBColor = None
-        WD_ALIGN_PARAGRAPH = None
-        WD_COLOR_INDEX = None
-
-# Optional PDF export dependency
-try:
-    # Works with both PyFPDF (fpdf) and fpdf2
-    from fpdf import FPDF
-    HAS_FPDF = True
-except ImportError:
-    HAS_FPDF = False
+from src.logic.formatting import style_tag_name
+
+# Plain-text file buffer: far fewer read()/write() syscalls than the ~4 KiB default.
+_IO_BUFSIZE = 128 * 1024
+# Lines fetched from the editor per get() when saving plain text.
+_SAVE_CHUNK_ROWS = 5000
+
+# Optional DOCX dependency. python-docx pulls in lxml, which is slow to import,
+# so it is only loaded by _get_docx() on the first DOCX open/save.
+HAS_DOCX = importlib.util.find_spec("docx") is not None
+Document = Pt = RGBColor = WD_ALIGN_PARAGRAPH = WD_COLOR_INDEX = None
+
+# Word highlight colors <-> the hex tags used in the editor (best-effort); filled by _get_docx().
+_HEX_TO_HL = {}
+_HL_TO_HEX = {}
+
+
+def _get_docx():
+    """Import python-docx on first use and build the highlight maps."""
+    global Document, Pt, RGBColor, WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
+    if Document is not None:
+        return
+    from docx import Document as _Document
+    from docx.shared import Pt, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
+    _HEX_TO_HL.update({
+        "#ffff00": WD_COLOR_INDEX.YELLOW,
+        "#00ff00": WD_COLOR_INDEX.BRIGHT_GREEN,
+        "#00ffff": WD_COLOR_INDEX.TURQUOISE,
+        "#ff00ff": WD_COLOR_INDEX.PINK,
+        "#0000ff": WD_COLOR_INDEX.BLUE,
+        "#ff0000": WD_COLOR_INDEX.RED,
+        "#000080": WD_COLOR_INDEX.DARK_BLUE,
+        "#008000": WD_COLOR_INDEX.GREEN,
+        "#800080": WD_COLOR_INDEX.VIOLET,
+        "#008080": WD_COLOR_INDEX.TEAL,
+        "#808080": WD_COLOR_INDEX.GRAY_50,
+        "#c0c0c0": WD_COLOR_INDEX.GRAY_25,
+        "#000000": WD_COLOR_INDEX.BLACK,
+        "#ffffff": WD_COLOR_INDEX.WHITE,
+    })
+    _HL_TO_HEX.update({v: k for k, v in _HEX_TO_HL.items()})
+    # Set last so a failed import is retried (and reported) on the next attempt.
+    Document = _Document
+
+# Optional PDF export dependency (imported on first export).
+# Works with both PyFPDF (fpdf) and fpdf2
+HAS_FPDF = importlib.util.find_spec("fpdf") is not None
+
+@functools.lru_cache(maxsize=512)
+def _style_bits(suffix):
+    """(b, i, u, o) flags from the part of a style tag name after its prefix."""
+    # Names end in fixed "_b?_i?_u?_o?" fields, so read them positionally.
+    parts = suffix.rsplit("_", 4)
+    if len(parts) < 5:
+        return False, False, False, False
+    return parts[1] == "b1", parts[2] == "i1", parts[3] == "u1", parts[4] == "o1"
+
+
+def _tk_len(text):
+    """Length of text in Tk index characters (UTF-16 code units before Tcl 9)."""
+    if tk.TkVersion < 9.0 and not text.isascii():
+        return len(text.encode("utf-16-le")) // 2
+    return len(text)
+
+
+_HEX6_RE = re.compile(r"^#?[0-9a-fA-F]{6}$")
+
+# Non-prefixed tags that change how a run is exported.
+_RUN_TAGS = frozenset({"bold", "italic", "underline", "overstrike", "left", "center", "right"})
+
+# Built-in PDF fonts have no tab glyph; expand tabs before latin-1 transcoding.
+_TAB_TRANSLATE = str.maketrans({"\t": "    "})
 
 class FileManager:
     def __init__(self, editor, root):
@@ -37,22 +91,70 @@ class FileManager:
         self.current_file_path = None
         # Keep references to dynamically-created tag fonts so Tk doesn't GC them.
         self._docx_fonts = {}
+        # (family, size_pt, b, i, u, o) -> style tag, so repeat runs skip naming entirely
+        self._style_tag_by_key = {}
+        self._align_tags_configured = False
+        # style tag -> (family, size_pt, b, i, u, o); reset at the start of each export
+        self._style_spec_cache = {}
+        # Files are read and parsed off the Tk thread; only the insert runs on it.
+        # Future of the latest open; older ones are ignored when they finish.
+        self._open_future = None
+        # Optional callable run after a document has been loaded into the editor.
+        self.on_load = None
 
     def open_file(self):
         file_types = [("Text/Word", "*.txt *.docx"), ("All", "*.*")]
         path = filedialog.askopenfilename(filetypes=file_types)
         if not path: return
 
+        fut = Future()
+        # Daemon thread rather than an executor: a slow read must not hold the process open at exit.
+        threading.Thread(target=self._read_into, args=(fut, path), daemon=True).start()
+        self._open_future = fut
+        # Read-only until the file arrives, so nothing typed meanwhile is silently replaced.
+        self.editor.config(state="disabled")
+        self.root.after(50, self._poll_open, fut, path)
+
+    def _read_into(self, fut, path):
+        """Worker thread: resolve `fut` with _read_file(path)."""
         try:
-            self.editor.delete("1.0", tk.END)
+            fut.set_result(self._read_file(path))
+        except BaseException as e:
+            fut.set_exception(e)
+
+    def _read_file(self, path):
+        """Worker thread: read and parse `path` without touching Tk."""
+        reader = _READERS.get(os.path.splitext(path)[1].lower(), FileManager._read_text)
+        return reader(self, path)
+
+    def _read_text(self, path):
+        with open(path, "r", encoding="utf-8", buffering=_IO_BUFSIZE) as f:
+            return "text", f.read()
+
+    def _read_docx(self, path):
+        return "docx", self._parse_docx(path)
 
-            if path.endswith(".docx") and HAS_DOCX:
+    def _poll_open(self, fut, path):
+        if not fut.done():
+            self.root.after(50, self._poll_open, fut, path)
+            return
+        # A newer open superseded this one.
+        if fut is not self._open_future: return
+        self._open_future = None
+        self.editor.config(state="normal")
+
+        try:
+            # The editor is cleared only once the file has been read,
+            # so a failed open leaves the current document untouched.
+            kind, content = fut.result()
+            self.editor.delete("1.0", tk.END)
+            if kind == "docx":
                 # Rich DOCX import: reconstruct formatting using Tk tags.
-                self._load_docx_with_formatting(path)
+                self._insert_docx_paragraphs(content)
             else:
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
                 self.editor.insert(tk.END, content)
+            if self.on_load:
+                self.on_load()
             
             # Update state ONLY on success
             self.current_file_path = path
@@ -75,29 +177,42 @@ class FileManager:
                 self.root.title(f"PyWord Pro - {os.path.basename(path)}")
 
     def _write_file(self, path):
+        # Write beside the target and swap it in, so a failed save never truncates the old file.
+        # The real target is replaced, so a symlink keeps pointing at the updated file.
+        target = os.path.realpath(path)
+        tmp = target + ".tmp"
+        writer = _WRITERS.get(os.path.splitext(path)[1].lower(), FileManager._write_text)
         try:
-            content = self.editor.get("1.0", tk.END)
-            if path.endswith(".docx") and HAS_DOCX:
-                self._export_docx_with_formatting(path)
-            else:
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            writer(self, tmp)
+            if os.path.exists(target):
+                shutil.copymode(target, tmp)
+            os.replace(tmp, target)
             return True
         except Exception as e:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
             messagebox.showerror("Save Error", str(e))
             return False
 
+    def _write_text(self, path):
+        with open(path, "w", encoding="utf-8", buffering=_IO_BUFSIZE) as f:
+            for chunk in self._iter_editor_chunks():
+                f.write(chunk)
+
+    def _iter_editor_chunks(self, rows=_SAVE_CHUNK_ROWS):
+        """Yield the editor text (as get("1.0", END)) a block of lines at a time."""
+        end_line = int(self.editor.index(tk.END).split(".")[0])
+        for start in range(1, end_line, rows):
+            yield self.editor.get(f"{start}.0", f"{min(start + rows, end_line)}.0")
+
     # ---------------------------
     # DOCX (Word) import/export
     # ---------------------------
 
     _STYLE_TAG_PREFIX = "pw_fontstyle_"
 
-    def _index_key(self, idx: str):
-        i = self.editor.index(idx)
-        ln, col = i.split(".")
-        return (int(ln), int(col))
-
     def _get_font_for_style_tag(self, tag: str):
         """Return a Tk Font for a combined style tag if available."""
         try:
@@ -110,67 +225,75 @@ class FileManager:
 
     def _parse_style_bits_from_tag(self, tag: str):
         """Parse b/i/u/o flags from combined style tag name."""
-        b = i = u = o = False
-        try:
-            parts = tag[len(self._STYLE_TAG_PREFIX):].split("_")
-            bits = {p[:1]: p[1:] for p in parts if len(p) == 2}
-            b = bits.get("b") == "1"
-            i = bits.get("i") == "1"
-            u = bits.get("u") == "1"
-            o = bits.get("o") == "1"
-        except Exception:
-            pass
-        return b, i, u, o
+        return _style_bits(tag[len(self._STYLE_TAG_PREFIX):])
+
+    def _is_run_tag(self, tag: str):
+        """True for tags that affect run formatting on export."""
+        return (
+            tag.startswith(self._STYLE_TAG_PREFIX)
+            or tag in _RUN_TAGS
+            or tag.startswith(("color_fg_", "color_bg_"))
+        )
 
-    def _tags_at(self, idx: str):
-        try:
-            return set(self.editor.tag_names(idx))
-        except tk.TclError:
-            return set()
+    def _iter_document_runs(self):
+        """Yield (line_start_tags, runs) per line; runs is a list of (text, tags).
 
-    def _tag_ranges_intersecting(self, tag: str, start: str, end: str):
-        """Yield (a,b) segments of tag ranges intersecting [start,end]."""
+        The text and every tag transition are fetched once for the whole
+        document; the active tag set is then carried from line to line.
+        """
         try:
-            ranges = self.editor.tag_ranges(tag)
+            lines = self.editor.get("1.0", "end-1c").split("\n")
+            events = self.editor.dump("1.0", "end", tag=True, image=True, window=True)
         except tk.TclError:
             return
-        for i in range(0, len(ranges), 2):
-            a = self.editor.index(ranges[i])
-            b = self.editor.index(ranges[i + 1])
-            # no overlap
-            if self.editor.compare(b, "<=", start) or self.editor.compare(a, ">=", end):
-                continue
-            s = a if self.editor.compare(a, ">", start) else start
-            e = b if self.editor.compare(b, "<", end) else end
-            if self.editor.compare(s, "<", e):
-                yield (s, e)
-
-    def _segment_boundaries(self, start: str, end: str):
-        """Compute boundaries where formatting might change within [start,end]."""
-        bounds = {self.editor.index(start), self.editor.index(end)}
-        all_tags = list(self.editor.tag_names())
-        relevant = []
-        for t in all_tags:
-            if t.startswith(self._STYLE_TAG_PREFIX) or t in {"bold", "italic", "underline", "overstrike", "left", "center", "right"}:
-                relevant.append(t)
-            elif t.startswith("color_fg_") or t.startswith("color_bg_"):
-                relevant.append(t)
-
-        for t in relevant:
-            for a, b in self._tag_ranges_intersecting(t, start, end):
-                bounds.add(self.editor.index(a))
-                bounds.add(self.editor.index(b))
-
-        return sorted(bounds, key=self._index_key)
-
-    def _effective_run_spec(self, idx: str):
-        """Return effective formatting spec at idx."""
-        tags = self._tags_at(idx)
-
-        # Base font from widget
+        by_line = defaultdict(list)
+        # Embedded images/windows take a column each but are left out of get().
+        embeds = defaultdict(int)
+        for kind, tag, ix in events:
+            if kind in ("image", "window"):
+                embeds[int(ix.split(".")[0])] += 1
+            elif self._is_run_tag(tag):
+                ln, col = ix.split(".")
+                by_line[int(ln)].append((int(col), kind == "tagon", tag))
+
+        active = set()
+        for ln, line_text in enumerate(lines, 1):
+            # Tk columns are UTF-16 units before Tcl 9 and count embedded objects;
+            # only slice when they match str indices.
+            line_len = _tk_len(line_text) + embeds[ln]
+            can_slice = line_len == len(line_text)
+            runs = []
+            start_tags = None
+            seg_start = 0
+            for col, on, tag in by_line.get(ln, ()):
+                if col != seg_start:
+                    if start_tags is None:
+                        start_tags = frozenset(active)
+                    if seg_start < line_len:
+                        text = line_text[seg_start:col] if can_slice else self.editor.get(f"{ln}.{seg_start}", f"{ln}.{col}")
+                        if text:
+                            runs.append((text, frozenset(active)))
+                    seg_start = col
+                if on:
+                    active.add(tag)
+                else:
+                    active.discard(tag)
+            if start_tags is None:
+                start_tags = frozenset(active)
+            if seg_start < line_len:
+                text = line_text[seg_start:] if can_slice else self.editor.get(f"{ln}.{seg_start}", f"{ln}.end")
+                if text:
+                    runs.append((text, frozenset(active)))
+            yield start_tags, runs
+
+    def _base_font_spec(self):
+        """(family, size_pt) of the editor's base font."""
         base = tkfont.Font(font=self.editor.cget("font"))
-        family = base.cget("family")
-        size_pt = int(base.cget("size"))
+        return base.cget("family"), int(base.cget("size"))
+
+    def _effective_run_spec(self, tags, base):
+        """Return the effective formatting spec for a run carrying `tags`; base is _base_font_spec()."""
+        family, size_pt = base
 
         b = i = u = o = False
 
@@ -179,14 +302,7 @@ class FileManager:
         if style_tags:
             # pick one (there should generally be one)
             st = sorted(style_tags)[0]
-            fnt = self._get_font_for_style_tag(st)
-            if fnt:
-                family = fnt.cget("family")
-                try:
-                    size_pt = int(fnt.cget("size"))
-                except Exception:
-                    pass
-            b, i, u, o = self._parse_style_bits_from_tag(st)
+            family, size_pt, b, i, u, o = self._style_tag_spec(st, family, size_pt)
         else:
             # Legacy tags
             b = "bold" in tags
@@ -213,36 +329,35 @@ class FileManager:
             "bg": bg,
         }
 
+    def _style_tag_spec(self, tag: str, family: str, size_pt: int):
+        """(family, size_pt, b, i, u, o) for a combined style tag, memoized per export."""
+        spec = self._style_spec_cache.get(tag)
+        if spec is None:
+            fnt = self._get_font_for_style_tag(tag)
+            if fnt:
+                family = fnt.cget("family")
+                try:
+                    size_pt = int(fnt.cget("size"))
+                except Exception:
+                    pass
+            spec = (family, size_pt) + self._parse_style_bits_from_tag(tag)
+            self._style_spec_cache[tag] = spec
+        return spec
+
     def _docx_highlight_from_hex(self, hex_color: str):
         """Map a #RRGGBB to a Word highlight color (best-effort)."""
-        if not hex_color or not WD_COLOR_INDEX:
+        if not hex_color:
             return None
-        h = hex_color.lower()
-        # common mappings
-        mapping = {
-            "#ffff00": WD_COLOR_INDEX.YELLOW,
-            "#00ff00": WD_COLOR_INDEX.BRIGHT_GREEN,
-            "#00ffff": WD_COLOR_INDEX.TURQUOISE,
-            "#ff00ff": WD_COLOR_INDEX.PINK,
-            "#0000ff": WD_COLOR_INDEX.BLUE,
-            "#ff0000": WD_COLOR_INDEX.RED,
-            "#000080": WD_COLOR_INDEX.DARK_BLUE,
-            "#008000": WD_COLOR_INDEX.GREEN,
-            "#800080": WD_COLOR_INDEX.VIOLET,
-            "#008080": WD_COLOR_INDEX.TEAL,
-            "#808080": WD_COLOR_INDEX.GRAY_50,
-            "#c0c0c0": WD_COLOR_INDEX.GRAY_25,
-            "#000000": WD_COLOR_INDEX.BLACK,
-            "#ffffff": WD_COLOR_INDEX.WHITE,
-        }
-        return mapping.get(h)
+        return _HEX_TO_HL.get(hex_color.lower())
 
     def _export_docx_with_formatting(self, path: str):
         """Export the current Tk editor contents to a .docx with runs."""
         if not HAS_DOCX:
             raise RuntimeError("python-docx is not installed")
 
+        _get_docx()
         doc = Document()
+        self._style_spec_cache.clear()
 
         # Remove the default empty paragraph if present and we will build our own.
         try:
@@ -252,40 +367,28 @@ class FileManager:
         except Exception:
             pass
 
-        end_idx = self.editor.index("end-1c")
-        total_lines = int(end_idx.split(".")[0])
+        # Resolved once per export rather than per run.
+        base_font = self._base_font_spec()
 
-        for ln in range(1, total_lines + 1):
-            ls = f"{ln}.0"
-            le = f"{ln}.0 lineend"
-
-            para = doc.add_paragraph()
+        add_paragraph = doc.add_paragraph
+        for start_tags, runs in self._iter_document_runs():
+            para = add_paragraph()
 
             # Paragraph alignment based on tag at line start.
-            tags = self._tags_at(ls)
             if WD_ALIGN_PARAGRAPH:
-                if "center" in tags:
+                if "center" in start_tags:
                     para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                elif "right" in tags:
+                elif "right" in start_tags:
                     para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
                 else:
                     para.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
-            # Empty line -> keep empty paragraph.
-            if self.editor.compare(ls, "==", le):
-                continue
-
-            bounds = self._segment_boundaries(ls, le)
-            for i in range(len(bounds) - 1):
-                a = bounds[i]
-                b = bounds[i + 1]
-                if not self.editor.compare(a, "<", b):
-                    continue
-                text = self.editor.get(a, b)
+            # Empty line -> no runs, keep empty paragraph.
+            for text, run_tags in runs:
                 if not text:
                     continue
 
-                spec = self._effective_run_spec(a)
+                spec = self._effective_run_spec(run_tags, base_font)
                 run = para.add_run(text)
 
                 run.bold = bool(spec["bold"])
@@ -304,10 +407,10 @@ class FileManager:
                     pass
 
                 # Text color
-                if RGBColor and spec.get("fg") and re.match(r"^#?[0-9a-fA-F]{6}$", spec["fg"]):
+                if RGBColor and spec.get("fg") and _HEX6_RE.match(spec["fg"]):
                     hexv = spec["fg"].lstrip("#")
                     try:
-                        run.font.color.rgb = RGBColor.from_string(hexv.upper())
+                        run.font.color.rgb = RGBColor(*bytes.fromhex(hexv))
                     except Exception:
                         pass
 
@@ -322,23 +425,20 @@ class FileManager:
         doc.save(path)
 
     def _make_style_tag_name(self, family: str, size_pt: int, b: bool, i: bool, u: bool, o: bool):
-        safe = re.sub(r"[^A-Za-z0-9]+", "-", family).strip("-") or "font"
-        fam_hash = hashlib.md5(family.encode("utf-8")).hexdigest()[:6]
-        bits = (
-            "b1" if b else "b0",
-            "i1" if i else "i0",
-            "u1" if u else "u0",
-            "o1" if o else "o0",
-        )
-        return f"{self._STYLE_TAG_PREFIX}f{safe}{fam_hash}_s{int(size_pt)}_" + "_".join(bits)
+        # Shared with FormatManager so both create the same tag for a style.
+        return style_tag_name(family, size_pt, b, i, u, o)
 
     def _ensure_style_tag(self, family: str, size_pt: int, b: bool, i: bool, u: bool, o: bool):
-        tag = self._make_style_tag_name(family, size_pt, b, i, u, o)
-        if tag in self._docx_fonts:
+        key = (family, size_pt, b, i, u, o)
+        tag = self._style_tag_by_key.get(key)
+        if tag is not None:
             return tag
-        fnt = tkfont.Font(family=family, size=int(size_pt), weight="bold" if b else "normal", slant="italic" if i else "roman", underline=1 if u else 0, overstrike=1 if o else 0)
-        self._docx_fonts[tag] = fnt
-        self.editor.tag_configure(tag, font=fnt)
+        tag = self._make_style_tag_name(family, size_pt, b, i, u, o)
+        if tag not in self._docx_fonts:
+            fnt = tkfont.Font(family=family, size=int(size_pt), weight="bold" if b else "normal", slant="italic" if i else "roman", underline=1 if u else 0, overstrike=1 if o else 0)
+            self._docx_fonts[tag] = fnt
+            self.editor.tag_configure(tag, font=fnt)
+        self._style_tag_by_key[key] = tag
         return tag
 
     def _ensure_color_tag(self, mode: str, hex_color: str):
@@ -352,26 +452,38 @@ class FileManager:
             pass
         return tag
 
-    def _load_docx_with_formatting(self, path: str):
-        """Load a .docx into the editor, reconstructing formatting tags."""
+    def _parse_docx(self, path: str):
+        """Read a .docx into [(align_tag, runs)], runs being
+        (text, family, size_pt, b, i, u, o, fg_hex, bg_hex).
+
+        Runs on the worker thread, so it must not touch Tk; family and
+        size_pt are None where the run inherits the editor's base font.
+        """
+        _get_docx()
         doc = Document(path)
-        self.editor.delete("1.0", tk.END)
 
-        insert_at = "1.0"
-        for pi, p in enumerate(doc.paragraphs):
-            # Apply alignment tags for this paragraph.
-            para_start = self.editor.index(insert_at)
+        paragraphs = []
+        # python-docx rebuilds this list from the XML on every access.
+        for p in doc.paragraphs:
+            # Paragraph alignment tag, carried by every run of the paragraph.
+            align_tag = None
+            try:
+                if p.alignment is not None:
+                    if WD_ALIGN_PARAGRAPH and p.alignment == WD_ALIGN_PARAGRAPH.CENTER:
+                        align_tag = "center"
+                    elif WD_ALIGN_PARAGRAPH and p.alignment == WD_ALIGN_PARAGRAPH.RIGHT:
+                        align_tag = "right"
+                    else:
+                        align_tag = "left"
+            except Exception:
+                pass
 
-            # Insert paragraph runs
+            runs = []
             for run in p.runs:
                 text = run.text or ""
                 if not text:
                     continue
-                start = self.editor.index(insert_at)
-                self.editor.insert(insert_at, text)
-                end = self.editor.index(f"{start}+{len(text)}c")
 
-                family = run.font.name or tkfont.Font(font=self.editor.cget("font")).cget("family")
                 # python-docx sizes are Length (EMU); use .pt when available
                 size_pt = None
                 try:
@@ -379,23 +491,12 @@ class FileManager:
                         size_pt = int(round(run.font.size.pt))
                 except Exception:
                     size_pt = None
-                if not size_pt:
-                    size_pt = int(tkfont.Font(font=self.editor.cget("font")).cget("size"))
-
-                b = bool(run.bold)
-                i = bool(run.italic)
-                u = bool(run.underline)
-                o = bool(getattr(run.font, "strike", False))
-
-                style_tag = self._ensure_style_tag(family, size_pt, b, i, u, o)
-                self.editor.tag_add(style_tag, start, end)
 
+                fg = bg = None
                 # Text color
                 try:
                     if run.font.color and run.font.color.rgb:
-                        hexv = "#" + str(run.font.color.rgb)
-                        ct = self._ensure_color_tag("fg", hexv)
-                        self.editor.tag_add(ct, start, end)
+                        fg = "#" + str(run.font.color.rgb)
                 except Exception:
                     pass
 
@@ -404,51 +505,48 @@ class FileManager:
                     hl = run.font.highlight_color
                     if hl is not None:
                         # Map known Word highlight to a rough hex.
-                        inv = {
-                            "YELLOW": "#ffff00",
-                            "BRIGHT_GREEN": "#00ff00",
-                            "TURQUOISE": "#00ffff",
-                            "PINK": "#ff00ff",
-                            "BLUE": "#0000ff",
-                            "RED": "#ff0000",
-                            "GREEN": "#008000",
-                            "VIOLET": "#800080",
-                            "TEAL": "#008080",
-                            "BLACK": "#000000",
-                            "WHITE": "#ffffff",
-                            "GRAY_50": "#808080",
-                            "GRAY_25": "#c0c0c0",
-                        }
-                        name = getattr(hl, "name", None) or str(hl)
-                        hexv = inv.get(str(name), None)
-                        if hexv:
-                            bt = self._ensure_color_tag("bg", hexv)
-                            self.editor.tag_add(bt, start, end)
+                        bg = _HL_TO_HEX.get(hl)
                 except Exception:
                     pass
 
-                insert_at = end
-
-            # Paragraph alignment tag over the whole paragraph.
-            try:
-                para_end = self.editor.index(insert_at)
-                if p.alignment is not None:
-                    if WD_ALIGN_PARAGRAPH and p.alignment == WD_ALIGN_PARAGRAPH.CENTER:
-                        self.editor.tag_configure("center", justify="center")
-                        self.editor.tag_add("center", para_start, para_end)
-                    elif WD_ALIGN_PARAGRAPH and p.alignment == WD_ALIGN_PARAGRAPH.RIGHT:
-                        self.editor.tag_configure("right", justify="right")
-                        self.editor.tag_add("right", para_start, para_end)
-                    else:
-                        self.editor.tag_configure("left", justify="left")
-                        self.editor.tag_add("left", para_start, para_end)
-            except Exception:
-                pass
+                runs.append((
+                    text, run.font.name, size_pt,
+                    bool(run.bold), bool(run.italic), bool(run.underline),
+                    bool(getattr(run.font, "strike", False)), fg, bg,
+                ))
+            paragraphs.append((align_tag, runs))
+        return paragraphs
+
+    def _insert_docx_paragraphs(self, paragraphs):
+        """Insert the output of _parse_docx into the editor, creating formatting tags."""
+        base_family, base_size = self._base_font_spec()
+
+        if not self._align_tags_configured:
+            for align in ("left", "center", "right"):
+                self.editor.tag_configure(align, justify=align)
+            self._align_tags_configured = True
+
+        last = len(paragraphs) - 1
+        # Interleaved text, tags, text, tags, ... so the whole document goes
+        # in, already tagged, with a single insert.
+        args = []
+        for pi, (align_tag, runs) in enumerate(paragraphs):
+            for text, family, size_pt, b, i, u, o, fg, bg in runs:
+                tags = [self._ensure_style_tag(family or base_family, size_pt or base_size, b, i, u, o)]
+                if fg:
+                    tags.append(self._ensure_color_tag("fg", fg))
+                if bg:
+                    tags.append(self._ensure_color_tag("bg", bg))
+                if align_tag:
+                    tags.append(align_tag)
+                args += (text, tuple(tags))
 
             # Newline between paragraphs (but not after last).
-            if pi != len(doc.paragraphs) - 1:
-                self.editor.insert(insert_at, "\n")
-                insert_at = self.editor.index(f"{insert_at}+1c")
+            if pi != last:
+                args += ("\n", ())
+
+        if args:
+            self.editor.insert("end-1c", *args)
 
     def export_pdf(self):
         """Export the current editor text to a PDF file."""
@@ -467,6 +565,8 @@ class FileManager:
             return
 
         try:
+            from fpdf import FPDF
+
             content = self.editor.get("1.0", tk.END).rstrip("\n")
 
             pdf = FPDF(format="A4", unit="mm")
@@ -477,12 +577,18 @@ class FileManager:
             # They are limited to latin-1; we replace unsupported chars to avoid crashes.
             pdf.set_font("Helvetica", size=12)
 
-            for line in content.splitlines() or [""]:
-                line = line.replace("\t", "    ")
-                safe_line = line.encode("latin-1", "replace").decode("latin-1")
-                pdf.multi_cell(0, 6, safe_line)
+            # Transcode the whole document once rather than line by line.
+            safe = content.translate(_TAB_TRANSLATE).encode("latin-1", "replace").decode("latin-1")
+            # multi_cell breaks on "\n" itself, so one call lays out every line
+            # (blank lines included) exactly as a call per line would.
+            pdf.multi_cell(0, 6, safe)
 
             pdf.output(path)
             messagebox.showinfo("PDF", f"Exported PDF successfully:\n{path}")
         except Exception as e:
             messagebox.showerror("PDF Export Error", str(e))
+
+
+# Extension (lower-cased) -> handler; anything else is read and written as plain UTF-8 text.
+_READERS = {".docx": FileManager._read_docx} if HAS_DOCX else {}
+_WRITERS = {".docx": FileManager._export_docx_with_formatting} if HAS_DOCX else {}
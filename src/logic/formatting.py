@@ -1,5 +1,6 @@
 import re
-import hashlib
+import functools
+from collections import deque
 import tkinter as tk
 from tkinter import font, colorchooser
 
@@ -7,18 +8,89 @@ from tkinter import font, colorchooser
 STYLE_TAG_PREFIX = "pw_fontstyle_"  # internal
 PARA_SPACE_TAG_PREFIX = "pw_para_space_"  # internal
 
+# Base size (@100% zoom) encoded in a combined style tag name, e.g. "..._s11_...".
+_SIZE_IN_TAG_RE = re.compile(r"_s(\d+)_")
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]+')
+# Numbered list item prefix, e.g. "3. ".
+_NUM_PREFIX_RE = re.compile(r"^(?P<num>\d+)\.\s+")
+
+# Formatting undo/redo entries kept; older ones are dropped.
+_FMT_HISTORY_LIMIT = 200
+
+# Style flag bits of a packed typing spec (family_id, size, flags).
+_BOLD, _ITALIC, _UNDERLINE, _OVERSTRIKE = 1, 2, 4, 8
+_FLAG_BITS = {'bold': _BOLD, 'italic': _ITALIC, 'underline': _UNDERLINE, 'overstrike': _OVERSTRIKE}
+
+# Legacy per-style tags from older docs/sessions.
+_LEGACY_STYLE_TAGS = ("bold", "italic", "underline", "overstrike")
+
+# Removes a list of tags from one range in a single Tcl call (args: widget, tags, first, last).
+_TCL_TAGS_REMOVE = "{w tags first last} {foreach t $tags {$w tag remove $t $first $last}}"
+# Same, then adds one tag over the range (args: widget, tags, first, last, new).
+_TCL_TAGS_REPLACE = "{w tags first last new} {foreach t $tags {$w tag remove $t $first $last}; $w tag add $new $first $last}"
+
+
+def _index_key(ix):
+    """Sort key for a normalized "line.col" Text index."""
+    ln, col = ix.split('.')
+    return int(ln), int(col)
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_family(family):
+    """Tag-name-safe slug for a font family."""
+    return _NON_ALNUM_RE.sub('-', family or '').strip('-') or 'font'
+
+
+# family <-> small int, assigned on first sight and shared by every manager,
+# so FormatManager and FileManager name the same style with the same tag.
+_FAMILY_IDS = {}
+_FAMILY_NAMES = []
+
+
+def _family_id(family):
+    fid = _FAMILY_IDS.get(family)
+    if fid is None:
+        fid = _FAMILY_IDS[family] = len(_FAMILY_NAMES)
+        _FAMILY_NAMES.append(family)
+    return fid
+
+
+def style_tag_name(family, size, b, italic, underline, overstrike):
+    """Combined style tag name for a (family, base size, b/i/u/o) spec."""
+    return _style_tag_name_cached(family, _family_id(family), int(size), bool(b), bool(italic), bool(underline), bool(overstrike))
+
+
+@functools.lru_cache(maxsize=512)
+def _style_tag_name_cached(family, fid, size, b, italic, underline, overstrike):
+    # Include family+base-size in the tag name so different size runs don't collide.
+    # The family id disambiguates families with the same slug.
+    safe = _safe_family(family)
+    bits = (
+        'b1' if b else 'b0',
+        'i1' if italic else 'i0',
+        'u1' if underline else 'u0',
+        'o1' if overstrike else 'o0',
+    )
+    return f"{STYLE_TAG_PREFIX}f{safe}fid{fid}_s{int(size)}_" + '_'.join(bits)
+
 
 class FormatManager:
     def __init__(self, editor, root):
         self.editor = editor
         self.root = root
         self.zoom_level = 100
+        # zoom_level / 100, kept in step by set_zoom (0 is treated as 100%).
+        self._zoom_scale = 1.0
         self.default_font = "Calibri"
         self.default_size = 11
 
         # Keep references to any dynamically created Tk Font objects used in
         # tag configurations so they don't get garbage collected.
         self._style_fonts = {}  # tag_name -> tkinter.font.Font
+        # Every STYLE_TAG_PREFIX tag known to exist in the widget, so range helpers
+        # don't have to list (and prefix-filter) all widget tags on each call.
+        self._style_tag_names = set()
 
 
         # Metadata for each combined-style tag so per-range size changes don't affect the whole document
@@ -32,8 +104,13 @@ class FormatManager:
         # We implement this by capturing the insert position on KeyPress and, after
         # Tk inserts text, applying a combined style tag to the newly inserted range.
         # This makes "click Bold, then type" work reliably (including across lines).
+        # Packed as (family_id, base_size, flags); see _pack_spec.
         self._typing_spec = None
         self._typing_enabled = False
+        # One pending idle callback styles everything typed since _typing_from,
+        # so a fast burst of keys costs a single tag update.
+        self._typing_idle = None
+        self._typing_from = None
 
         try:
             self.editor.bind('<KeyPress>', self._on_keypress_capture_insert, add=True)
@@ -48,8 +125,8 @@ class FormatManager:
         # formatting changes (e.g., alignment). We therefore keep a small,
         # explicit formatting undo/redo stack and only use it when a
         # formatting button was the most recent user action.
-        self._fmt_undo_stack = []  # list[dict[str, callable]]
-        self._fmt_redo_stack = []
+        self._fmt_undo_stack = deque(maxlen=_FMT_HISTORY_LIMIT)  # deque[dict[str, callable]]
+        self._fmt_redo_stack = deque(maxlen=_FMT_HISTORY_LIMIT)
         self._last_action_kind = "text"  # "text" | "format"
         self._last_undo_kind = None  # None | "format" | "text"
 
@@ -114,6 +191,10 @@ class FormatManager:
             e_line -= 1
         return range(s_line, max(s_line, e_line) + 1)
 
+    def _get_lines(self, line_nos):
+        """Text of each line in the contiguous range `line_nos`, fetched with one get()."""
+        return self.editor.get(f"{line_nos[0]}.0", f"{line_nos[-1]}.0 lineend").split("\n")
+
     def _get_line_align(self, line_no):
         idx = f"{line_no}.0"
         tags = self.editor.tag_names(idx)
@@ -147,12 +228,7 @@ class FormatManager:
 
     def _scaled_size(self, base_size: int) -> int:
         # Convert a base font size (at 100% zoom) into the current zoom-scaled size.
-        try:
-            z = int(self.zoom_level) if self.zoom_level else 100
-        except Exception:
-            z = 100
-        sz = int(round(base_size * (z / 100.0)))
-        return max(1, sz)
+        return max(1, int(round(base_size * self._zoom_scale)))
 
     def _get_effective_spec_at(self, index: str):
         # Return the effective (family, base_size, b,i,u,o) at a given index.
@@ -178,7 +254,7 @@ class FormatManager:
             fnt = self._style_fonts.get(t)
             if fnt:
                 try:
-                    base_sz = int(round(int(fnt.cget('size')) * 100 / max(1, int(self.zoom_level or 100))))
+                    base_sz = int(round(int(fnt.cget('size')) / self._zoom_scale))
                 except Exception:
                     base_sz = self.default_size
                 return {
@@ -213,36 +289,81 @@ class FormatManager:
         self._remove_style_tags_in_range(start, end)
         self.editor.tag_add(new_tag, start, end)
 
-    def _is_default_spec(self, spec: dict) -> bool:
-        """Return True if spec is the plain/default font with no styles."""
-        try:
-            return (
-                spec.get('family') == self.default_font
-                and int(spec.get('size')) == int(self.default_size)
-                and not spec.get('b')
-                and not spec.get('i')
-                and not spec.get('u')
-                and not spec.get('o')
-            )
-        except Exception:
-            return False
+    def _pack_spec(self, spec: dict):
+        """Spec dict -> (family_id, size, flags)."""
+        flags = (
+            (_BOLD if spec['b'] else 0)
+            | (_ITALIC if spec['i'] else 0)
+            | (_UNDERLINE if spec['u'] else 0)
+            | (_OVERSTRIKE if spec['o'] else 0)
+        )
+        return _family_id(spec['family']), int(spec['size']), flags
 
-    def _style_boundaries_in_range(self, start: str, end: str):
-        """Return sorted boundary indices where the effective style may change."""
-        bounds = {self.editor.index(start), self.editor.index(end)}
-        for t in self.editor.tag_names():
-            if not t.startswith(STYLE_TAG_PREFIX):
-                continue
-            for a, b in self._snapshot_tag_ranges(t, start, end):
-                bounds.add(self.editor.index(a))
-                bounds.add(self.editor.index(b))
+    def _unpack_spec(self, packed) -> dict:
+        fid, size, flags = packed
+        return {
+            'family': _FAMILY_NAMES[fid],
+            'size': size,
+            'b': bool(flags & _BOLD),
+            'i': bool(flags & _ITALIC),
+            'u': bool(flags & _UNDERLINE),
+            'o': bool(flags & _OVERSTRIKE),
+        }
 
-        def _key(ix: str):
-            ix = self.editor.index(ix)
-            ln, col = ix.split('.')
-            return (int(ln), int(col))
+    def _default_typing_spec(self):
+        """Packed spec of the plain/default font with no styles."""
+        return _family_id(self.default_font), int(self.default_size), 0
 
-        return sorted(bounds, key=_key)
+    def _style_boundaries_in_range(self, start: str, end: str):
+        """Return sorted boundary indices where the effective style may change."""
+        ed = self.editor
+        start, end = ed.index(start), ed.index(end)
+        bounds = {start, end}
+        s_key, e_key = _index_key(start), _index_key(end)
+        # Legacy tags count too: undo restores each segment's tags from its
+        # start, so they must not change mid-segment either.
+        for t in (*self._style_tag_names, *_LEGACY_STYLE_TAGS):
+            # A run that began before `start` only contributes its end.
+            prev = ed.tag_prevrange(t, start)
+            cur = start
+            if prev and _index_key(prev[1]) > s_key:
+                if _index_key(prev[1]) >= e_key:
+                    continue
+                bounds.add(prev[1])
+                cur = prev[1]
+            # tag_nextrange only reports runs starting before `end`.
+            while True:
+                rng = ed.tag_nextrange(t, cur, end)
+                if not rng:
+                    break
+                a, b = rng
+                bounds.add(a)
+                if _index_key(b) >= e_key:
+                    break
+                bounds.add(b)
+                cur = b
+
+        # Tk already returns normalized "line.col" indices here.
+        return sorted(bounds, key=_index_key)
+
+    def _uniform_style_tag(self, start: str, end: str):
+        """The style tag if one style run covers all of [start, end], else None.
+
+        start and end must be normalized indices.
+        """
+        at_start = self.editor.tag_names(start)
+        tags = [t for t in at_start if t in self._style_tag_names]
+        if len(tags) != 1:
+            return None
+        # Legacy tags in the range would need their own segments (see _style_boundaries_in_range).
+        for t in _LEGACY_STYLE_TAGS:
+            if t in at_start or self.editor.tag_nextrange(t, start, end):
+                return None
+        # The run containing `start` is the last one starting at or before it.
+        rng = self.editor.tag_prevrange(tags[0], f"{start}+1c")
+        if rng and _index_key(rng[1]) >= _index_key(end):
+            return tags[0]
+        return None
 
     def _iter_style_segments(self, start: str, end: str):
         """Yield (seg_start, seg_end, spec) for each contiguous style segment."""
@@ -268,30 +389,33 @@ class FormatManager:
         if not self._typing_enabled or not self._typing_spec:
             return
 
-        try:
-            before = self.editor.index('insert')
-        except tk.TclError:
-            return
-
-        # Apply after Tk has performed the default key action.
-        try:
-            self.editor.after_idle(lambda: self._apply_typing_to_newly_inserted(before))
-        except Exception:
-            pass
+        self._schedule_typing_apply()
 
     def _on_paste_capture_insert(self, evt=None):
         """Ensure paste operations also inherit the typing style."""
         if not self._typing_enabled or not self._typing_spec:
             return
+        self._schedule_typing_apply()
+
+    def _schedule_typing_apply(self):
+        # Already pending: that callback will cover this key too.
+        if self._typing_idle is not None:
+            return
         try:
-            before = self.editor.index('insert')
+            self._typing_from = self.editor.index('insert')
         except tk.TclError:
             return
+
+        # Apply after Tk has performed the default key action.
         try:
-            self.editor.after_idle(lambda: self._apply_typing_to_newly_inserted(before))
+            self._typing_idle = self.editor.after_idle(self._apply_pending_typing)
         except Exception:
             pass
 
+    def _apply_pending_typing(self):
+        self._typing_idle = None
+        self._apply_typing_to_newly_inserted(self._typing_from)
+
     def _apply_typing_to_newly_inserted(self, before_index: str):
         """Apply typing style to the range inserted since before_index."""
         if not self._typing_enabled or not self._typing_spec:
@@ -309,27 +433,23 @@ class FormatManager:
             return
 
         try:
-            self._apply_spec_to_range(self._typing_spec, before_index, after)
+            self._apply_spec_to_range(self._unpack_spec(self._typing_spec), before_index, after)
         except Exception:
             pass
 
-    def _refresh_style_fonts(self):
-        """Recompute tag font sizes when zoom changes.
+    def adopt_style_tags(self):
+        """Track combined-style tags created outside this manager.
 
-        Important: documents can create style tags outside of this manager
-        (e.g., when opening .pwp/.docx). Those tags still need to scale with
-        zoom, so we *discover* any existing combined-style tags in the widget
-        and add them to our caches before resizing.
+        Documents can create style tags without going through
+        _ensure_style_tag (e.g., when opening .pwp/.docx). Call this after such
+        a load so the tags are found by the range helpers and scale with zoom.
         """
-
-        # 1) Discover any STYLE_TAG_PREFIX tags that exist but aren't tracked yet.
         try:
-            import re as _re
-
             for t in self.editor.tag_names():
                 if not t.startswith(STYLE_TAG_PREFIX):
                     continue
                 if t in self._style_fonts:
+                    self._style_tag_names.add(t)
                     continue
 
                 try:
@@ -343,7 +463,7 @@ class FormatManager:
                 # Derive base size @100% zoom from tag name if present.
                 base_sz = None
                 try:
-                    m = _re.search(r"_s(\d+)_", t)
+                    m = _SIZE_IN_TAG_RE.search(t)
                     if m:
                         base_sz = int(m.group(1))
                 except Exception:
@@ -351,7 +471,7 @@ class FormatManager:
 
                 if base_sz is None:
                     try:
-                        base_sz = int(round(int(fnt_obj.cget('size')) * 100 / max(1, int(self.zoom_level or 100))))
+                        base_sz = int(round(int(fnt_obj.cget('size')) / self._zoom_scale))
                     except Exception:
                         base_sz = self.default_size
 
@@ -368,6 +488,7 @@ class FormatManager:
                     pass
 
                 self._style_fonts[t] = fnt_obj
+                self._style_tag_names.add(t)
                 self._style_meta[t] = {
                     'family': fnt_obj.cget('family'),
                     'size': base_sz,
@@ -379,6 +500,12 @@ class FormatManager:
         except Exception:
             pass
 
+    def _refresh_style_fonts(self):
+        """Recompute tag font sizes when zoom changes."""
+
+        # 1) Pick up any STYLE_TAG_PREFIX tags that exist but aren't tracked yet.
+        self.adopt_style_tags()
+
         # 2) Resize all tracked style fonts based on their base size.
         for t, fnt in list(self._style_fonts.items()):
             meta = self._style_meta.get(t)
@@ -406,15 +533,21 @@ class FormatManager:
 
             if has_sel:
                 start, end = self.editor.index('sel.first'), self.editor.index('sel.last')
-                before = self._snapshot_style_ranges(start, end)
 
                 # Split the selection into contiguous style segments so we don't
                 # wipe out mixed formatting. Each segment toggles independently.
-                segments = list(self._iter_style_segments(start, end))
+                # A selection inside a single style run is one segment; skip the boundary scan.
+                if self._uniform_style_tag(start, end):
+                    segments = [(start, end, self._get_effective_spec_at(start))]
+                else:
+                    segments = list(self._iter_style_segments(start, end))
+
+                # Tags each segment carried before, for undo.
+                priors = [self._style_tags_at(s) for s, _e, _spec in segments]
+                changes = []
 
-                # Clear existing style tags once, then re-apply combined tags.
-                self._remove_style_tags_in_range(start, end)
-                for s, e, spec in segments:
+                # Swap each segment's own style tags for its new combined tag.
+                for (s, e, spec), prior in zip(segments, priors):
                     spec = dict(spec)
                     if tag == 'bold':
                         spec['b'] = not spec['b']
@@ -433,52 +566,32 @@ class FormatManager:
                         underline=bool(spec['u']),
                         overstrike=bool(spec['o']),
                     )
-                    self.editor.tag_add(tname, s, e)
-                after = self._snapshot_style_ranges(start, end)
+                    self._replace_style_tags(s, e, prior, tname)
+                    changes.append((s, e, prior, (tname,)))
 
-                def _restore(snapshot):
-                    self._remove_style_tags_in_range(start, end)
-                    for tname, ranges in snapshot.items():
-                        for a, b2 in ranges:
-                            self.editor.tag_add(tname, a, b2)
-
-                self._push_fmt_action(lambda: _restore(before), lambda: _restore(after))
+                self._push_segment_changes(start, end, changes)
 
             else:
                 # No selection: enable typing-mode formatting.
                 self._typing_enabled = True
-                # Use the character to the left of the cursor as the current context if possible.
-                try:
-                    left_idx = self.editor.index('insert-1c')
-                    if self.editor.compare(left_idx, '<', '1.0'):
-                        raise ValueError
-                    base = self._get_effective_spec_at(left_idx)
-                except Exception:
-                    base = {
-                        'family': self.default_font,
-                        'size': self.default_size,
-                        'b': False,
-                        'i': False,
-                        'u': False,
-                        'o': False,
-                    }
-
-                # If we already have a typing spec, start from it.
-                if self._typing_spec:
-                    base = dict(self._typing_spec)
-
-                if tag == 'bold':
-                    base['b'] = not base['b']
-                elif tag == 'italic':
-                    base['i'] = not base['i']
-                elif tag == 'underline':
-                    base['u'] = not base['u']
-                elif tag == 'overstrike':
-                    base['o'] = not base['o']
+                # If we already have a typing spec, start from it; otherwise use the
+                # character to the left of the cursor as the current context if possible.
+                base = self._typing_spec
+                if base is None:
+                    try:
+                        left_idx = self.editor.index('insert-1c')
+                        if self.editor.compare(left_idx, '<', '1.0'):
+                            raise ValueError
+                        base = self._pack_spec(self._get_effective_spec_at(left_idx))
+                    except Exception:
+                        base = self._default_typing_spec()
+
+                fid, size, flags = base
+                base = (fid, size, flags ^ _FLAG_BITS[tag])
 
                 # If the resulting spec is the plain default, disable typing-mode
                 # so we don't add unnecessary tags while typing.
-                if self._is_default_spec(base):
+                if base == self._default_typing_spec():
                     self._typing_spec = None
                     self._typing_enabled = False
                 else:
@@ -489,16 +602,7 @@ class FormatManager:
 
         self._checkpoint()
     def _style_tag_name(self, *, family: str, size: int, b: bool, italic: bool, underline: bool, overstrike: bool) -> str:
-        # Include family+base-size in the tag name so different size runs don't collide.
-        safe = re.sub(r'[^A-Za-z0-9]+', '-', family).strip('-') or 'font'
-        fam_hash = hashlib.md5(family.encode('utf-8')).hexdigest()[:6]
-        bits = (
-            'b1' if b else 'b0',
-            'i1' if italic else 'i0',
-            'u1' if underline else 'u0',
-            'o1' if overstrike else 'o0',
-        )
-        return f"{STYLE_TAG_PREFIX}f{safe}{fam_hash}_s{int(size)}_" + '_'.join(bits)
+        return style_tag_name(family, size, b, italic, underline, overstrike)
     def _ensure_style_tag(self, *, family: str, size: int, b: bool, italic: bool, underline: bool, overstrike: bool) -> str:
         # Create (if needed) and return a combined-style tag name.
         name = self._style_tag_name(family=family, size=size, b=b, italic=italic, underline=underline, overstrike=overstrike)
@@ -514,6 +618,7 @@ class FormatManager:
             overstrike=1 if overstrike else 0,
         )
         self._style_fonts[name] = f
+        self._style_tag_names.add(name)
         self._style_meta[name] = {
             'family': family,
             'size': int(size),
@@ -535,7 +640,10 @@ class FormatManager:
         for t in tags:
             if not t.startswith(STYLE_TAG_PREFIX):
                 continue
-            # Parse bits from the tag name.
+            meta = self._style_meta.get(t)
+            if meta:
+                return meta['b'], meta['i'], meta['u'], meta['o']
+            # Untracked tag (not yet adopted): parse bits from the tag name.
             parts = t[len(STYLE_TAG_PREFIX):].split("_")
             bits = {p[:1]: p[1:] for p in parts if len(p) == 2}
             return (
@@ -554,48 +662,61 @@ class FormatManager:
         )
 
     def _remove_style_tags_in_range(self, start: str, end: str):
-        for t in list(self.editor.tag_names()):
-            if t.startswith(STYLE_TAG_PREFIX):
-                self.editor.tag_remove(t, start, end)
         # Remove legacy tags too so we don't get mixed behavior.
-        for t in ("bold", "italic", "underline", "overstrike"):
-            try:
-                self.editor.tag_remove(t, start, end)
-            except tk.TclError:
-                pass
+        tags = (*self._style_tag_names, *_LEGACY_STYLE_TAGS)
+        self.editor.tk.call("apply", _TCL_TAGS_REMOVE, str(self.editor), tags, start, end)
+
+    def _replace_style_tags(self, start: str, end: str, present, tag: str):
+        """Swap the style tags `present` on [start, end] for `tag` in one Tcl call."""
+        # Legacy tags can change mid-segment, so they are always cleared.
+        tags = (*present, *_LEGACY_STYLE_TAGS)
+        self.editor.tk.call("apply", _TCL_TAGS_REPLACE, str(self.editor), tags, start, end, tag)
+
+    def _style_tags_at(self, index: str):
+        """Style (and legacy style) tags present at index."""
+        return tuple(
+            t for t in self.editor.tag_names(index)
+            if t in self._style_tag_names or t in _LEGACY_STYLE_TAGS
+        )
+
+    def _push_segment_changes(self, start: str, end: str, changes):
+        """Push an undo entry for a restyle of [start, end].
+
+        changes is a list of (seg_start, seg_end, tags_before, tags_after);
+        undo/redo clear the range and re-tag each segment directly.
+        """
+        def _replay(which):
+            self._remove_style_tags_in_range(start, end)
+            for ch in changes:
+                for t in ch[which]:
+                    self.editor.tag_add(t, ch[0], ch[1])
 
-    def _snapshot_style_ranges(self, start: str, end: str):
-        """Snapshot all combined-style tag ranges intersecting [start, end]."""
-        snap = {}
-        for t in self.editor.tag_names():
-            if t.startswith(STYLE_TAG_PREFIX):
-                ranges = self._snapshot_tag_ranges(t, start, end)
-                if ranges:
-                    snap[t] = ranges
-        # Include legacy tags if they exist.
-        for t in ("bold", "italic", "underline", "overstrike"):
-            ranges = self._snapshot_tag_ranges(t, start, end)
-            if ranges:
-                snap[t] = ranges
-        return snap
+        self._push_fmt_action(lambda: _replay(2), lambda: _replay(3))
 
     def _snapshot_tag_ranges(self, tag, start, end):
         """Return a list of (start, end) ranges for `tag` intersecting [start, end]."""
         out = []
         try:
             ranges = self.editor.tag_ranges(tag)
+            if not ranges:
+                return out
+            start, end = self.editor.index(start), self.editor.index(end)
         except tk.TclError:
             return out
+        # tag_ranges already yields canonical "line.col" indices, so the
+        # intersection can be worked out in Python.
+        s_key, e_key = _index_key(start), _index_key(end)
         for i in range(0, len(ranges), 2):
-            a = self.editor.index(ranges[i])
-            b = self.editor.index(ranges[i + 1])
+            a = str(ranges[i])
+            b = str(ranges[i + 1])
+            a_key, b_key = _index_key(a), _index_key(b)
 
             # intersection = [max(a,start), min(b,end)] if they overlap
-            if self.editor.compare(b, "<=", start) or self.editor.compare(a, ">=", end):
+            if b_key <= s_key or a_key >= e_key:
                 continue
-            s = a if self.editor.compare(a, ">", start) else start
-            e = b if self.editor.compare(b, "<", end) else end
-            if self.editor.compare(s, "<", e):
+            s = a if a_key > s_key else start
+            e = b if b_key < e_key else end
+            if _index_key(s) < _index_key(e):
                 out.append((s, e))
         return out
 
@@ -635,7 +756,6 @@ class FormatManager:
         - When adding bullets, strip an existing numbered prefix (e.g., "1. ").
         """
         bullet = "• "
-        num_re = re.compile(r"^(?P<num>\d+)\.\s+")
         self._checkpoint()
 
         try:
@@ -645,27 +765,24 @@ class FormatManager:
                 start = self.editor.index("insert linestart")
                 end = self.editor.index("insert lineend")
 
-            line_nos = list(self._each_line_in_range(start, end))
+            line_nos = self._each_line_in_range(start, end)
 
-            def _line_info(ln: int):
+            def _line_info(ln: int, txt: str):
                 ls = f"{ln}.0"
                 le = f"{ln}.0 lineend"
-                txt = self.editor.get(ls, le)
                 # preserve indentation
-                indent = 0
-                while indent < len(txt) and txt[indent] in (" ", "\t"):
-                    indent += 1
+                indent = len(txt) - len(txt.lstrip(" \t"))
                 tail = txt[indent:]
                 is_b = tail.startswith(bullet)
-                m = num_re.match(tail)
+                m = _NUM_PREFIX_RE.match(tail)
                 num_len = len(m.group(0)) if m else 0
                 return ls, le, txt, indent, is_b, num_len
 
             # Determine whether we should add or remove bullets.
             relevant = []
             all_bulleted = True
-            for ln in line_nos:
-                ls, le, txt, indent, is_b, num_len = _line_info(ln)
+            for ln, txt in zip(line_nos, self._get_lines(line_nos)):
+                ls, le, txt, indent, is_b, num_len = _line_info(ln, txt)
                 if txt.strip() == "":
                     # ignore empty lines for the toggle decision
                     relevant.append((ls, le, txt, indent, is_b, num_len))
@@ -700,7 +817,6 @@ class FormatManager:
         - When adding numbering, strip an existing bullet prefix ("• ").
         """
         bullet = "• "
-        num_re = re.compile(r"^(?P<num>\d+)\.\s+")
         self._checkpoint()
 
         try:
@@ -710,26 +826,22 @@ class FormatManager:
                 start = self.editor.index("insert linestart")
                 end = self.editor.index("insert lineend")
 
-            line_nos = list(self._each_line_in_range(start, end))
+            line_nos = self._each_line_in_range(start, end)
 
             items = []  # (ls, txt, indent, is_num, num_len, is_bullet)
             all_numbered = True
 
-            for ln in line_nos:
+            for ln, txt in zip(line_nos, self._get_lines(line_nos)):
                 ls = f"{ln}.0"
-                le = f"{ln}.0 lineend"
-                txt = self.editor.get(ls, le)
 
-                indent = 0
-                while indent < len(txt) and txt[indent] in (" ", "\t"):
-                    indent += 1
+                indent = len(txt) - len(txt.lstrip(" \t"))
 
                 if txt.strip() == "":
                     items.append((ls, txt, indent, False, 0, False))
                     continue
 
                 tail = txt[indent:]
-                m = num_re.match(tail)
+                m = _NUM_PREFIX_RE.match(tail)
                 is_num = bool(m)
                 num_len = len(m.group(0)) if m else 0
                 is_b = tail.startswith(bullet)
@@ -796,7 +908,6 @@ class FormatManager:
         - If the current line is an *empty* numbered item, Enter exits the list.
         """
         bullet = "• "
-        num_re = re.compile(r"^(?P<num>\d+)\.\s+")
 
         try:
             line_start = self.editor.index("insert linestart")
@@ -827,7 +938,7 @@ class FormatManager:
                 return "break"
 
             # Numbered continuation
-            m = num_re.match(tail)
+            m = _NUM_PREFIX_RE.match(tail)
             if m:
                 prefix_len = len(m.group(0))
                 cur_num = int(m.group("num"))
@@ -956,10 +1067,10 @@ class FormatManager:
         try:
             if self.editor.tag_ranges('sel'):
                 start, end = self.editor.index('sel.first'), self.editor.index('sel.last')
-                before = self._snapshot_style_ranges(start, end)
                 segments = list(self._iter_style_segments(start, end))
-                self._remove_style_tags_in_range(start, end)
-                for s, e, spec in segments:
+                priors = [self._style_tags_at(s) for s, _e, _spec in segments]
+                changes = []
+                for (s, e, spec), prior in zip(segments, priors):
                     spec = dict(spec)
                     spec['family'] = name
                     tname = self._ensure_style_tag(
@@ -970,16 +1081,10 @@ class FormatManager:
                         underline=bool(spec['u']),
                         overstrike=bool(spec['o']),
                     )
-                    self.editor.tag_add(tname, s, e)
-                after = self._snapshot_style_ranges(start, end)
-
-                def _restore(snapshot):
-                    self._remove_style_tags_in_range(start, end)
-                    for tname, ranges in snapshot.items():
-                        for a, b2 in ranges:
-                            self.editor.tag_add(tname, a, b2)
+                    self._replace_style_tags(s, e, prior, tname)
+                    changes.append((s, e, prior, (tname,)))
 
-                self._push_fmt_action(lambda: _restore(before), lambda: _restore(after))
+                self._push_segment_changes(start, end, changes)
                 return
         except Exception:
             pass
@@ -987,16 +1092,8 @@ class FormatManager:
         # No selection -> set typing/default font for future typing (do NOT resize existing text)
         self.default_font = name
         # enable typing mode so the next characters inherit the font
-        base = dict(self._typing_spec) if self._typing_spec else {
-            'family': self.default_font,
-            'size': self.default_size,
-            'b': False,
-            'i': False,
-            'u': False,
-            'o': False,
-        }
-        base['family'] = name
-        self._typing_spec = base
+        _fid, size, flags = self._typing_spec or self._default_typing_spec()
+        self._typing_spec = (_family_id(name), size, flags)
         self._typing_enabled = True
         self._checkpoint()
 
@@ -1011,10 +1108,10 @@ class FormatManager:
         try:
             if self.editor.tag_ranges('sel'):
                 start, end = self.editor.index('sel.first'), self.editor.index('sel.last')
-                before = self._snapshot_style_ranges(start, end)
                 segments = list(self._iter_style_segments(start, end))
-                self._remove_style_tags_in_range(start, end)
-                for s, e, spec in segments:
+                priors = [self._style_tags_at(s) for s, _e, _spec in segments]
+                changes = []
+                for (s, e, spec), prior in zip(segments, priors):
                     spec = dict(spec)
                     spec['size'] = size
                     tname = self._ensure_style_tag(
@@ -1025,46 +1122,35 @@ class FormatManager:
                         underline=bool(spec['u']),
                         overstrike=bool(spec['o']),
                     )
-                    self.editor.tag_add(tname, s, e)
-                after = self._snapshot_style_ranges(start, end)
+                    self._replace_style_tags(s, e, prior, tname)
+                    changes.append((s, e, prior, (tname,)))
 
-                def _restore(snapshot):
-                    self._remove_style_tags_in_range(start, end)
-                    for tname, ranges in snapshot.items():
-                        for a, b2 in ranges:
-                            self.editor.tag_add(tname, a, b2)
-
-                self._push_fmt_action(lambda: _restore(before), lambda: _restore(after))
+                self._push_segment_changes(start, end, changes)
                 return
         except Exception:
             pass
 
         # No selection -> set typing/default size for future typing (do NOT resize existing text)
         self.default_size = size
-        base = dict(self._typing_spec) if self._typing_spec else {
-            'family': self.default_font,
-            'size': self.default_size,
-            'b': False,
-            'i': False,
-            'u': False,
-            'o': False,
-        }
-        base['size'] = size
-        self._typing_spec = base
+        fid, _size, flags = self._typing_spec or self._default_typing_spec()
+        self._typing_spec = (fid, size, flags)
         self._typing_enabled = True
         self._checkpoint()
 
-    def set_zoom(self, val):
+    def set_zoom(self, val, apply_tags=True):
         self.zoom_level = int(val)
-        self.update_font_visuals()
+        self._zoom_scale = (self.zoom_level or 100) / 100.0
+        self.update_font_visuals(apply_tags)
 
-    def update_font_visuals(self):
+    def update_font_visuals(self, apply_tags=True):
         size = int((self.default_size * self.zoom_level) / 100)
         if size < 1:
             size = 1
         pad = int(50 * (self.zoom_level / 100))
         self.editor.configure(font=(self.default_font, size))
         self.editor.configure(padx=pad, pady=pad)
+        if not apply_tags:
+            return
         try:
             self._refresh_style_fonts()
         except Exception:
@@ -1,27 +1,46 @@
 import threading
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 
-try:
-    import pyttsx3
-    HAS_TTS = True
-except ImportError:
-    HAS_TTS = False
-
-try:
-    from spellchecker import SpellChecker
-    HAS_SPELL = True
-except ImportError:
-    HAS_SPELL = False
+# Both libraries are slow to import/initialise (dictionary load, TTS driver),
+# so only check availability here and load them on first use.
+HAS_TTS = importlib.util.find_spec("pyttsx3") is not None
+HAS_SPELL = importlib.util.find_spec("spellchecker") is not None
 
 class TextProcessor:
     def __init__(self, editor_widget):
         self.editor = editor_widget
-        self.spell = SpellChecker() if HAS_SPELL else None
-        self.tts_engine = pyttsx3.init() if HAS_TTS else None
+        self._spell = None
+        self._tts_engine = None
+
+    # Both return None if the library is missing or fails to initialise; an
+    # installed-but-broken package is then treated as missing from then on.
+    @property
+    def spell(self):
+        global HAS_SPELL
+        if self._spell is None and HAS_SPELL:
+            try:
+                from spellchecker import SpellChecker
+                self._spell = SpellChecker()
+            except Exception:
+                HAS_SPELL = False
+        return self._spell
+
+    @property
+    def tts_engine(self):
+        global HAS_TTS
+        if self._tts_engine is None and HAS_TTS:
+            try:
+                import pyttsx3
+                self._tts_engine = pyttsx3.init()
+            except Exception:
+                HAS_TTS = False
+        return self._tts_engine
 
     def run_spell_check(self):
-        if not HAS_SPELL:
+        spell = self.spell
+        if spell is None:
             messagebox.showerror("Error", "pyspellchecker library is missing.")
             return
         
@@ -34,7 +53,7 @@ class TextProcessor:
         words = text.split()
         clean_words = [w.strip(".,!?\"'") for w in words]
         
-        misspelled = self.spell.unknown(clean_words)
+        misspelled = spell.unknown(clean_words)
 
         if not misspelled:
             messagebox.showinfo("Spell Check", "No spelling errors found.")
@@ -53,7 +72,9 @@ class TextProcessor:
         messagebox.showinfo("Spell Check", f"Found {len(misspelled)} potential errors.")
 
     def read_aloud(self):
-        if not HAS_TTS: 
+        # Initialise the engine here (UI thread); speaking happens on a worker thread.
+        engine = self.tts_engine
+        if engine is None:
             messagebox.showerror("Error", "pyttsx3 library is missing.")
             return
         
@@ -66,9 +87,9 @@ class TextProcessor:
         if not text.strip(): 
             return
 
-        # Run in a separate thread so the UI doesn't freeze
-        threading.Thread(target=self._speak, args=(text,), daemon=True).start()
+        # Speak in a separate thread so the UI doesn't freeze
+        threading.Thread(target=self._speak, args=(engine, text), daemon=True).start()
 
-    def _speak(self, text):
-        self.tts_engine.say(text)
-        self.tts_engine.runAndWait()
\ No newline at end of file
+    def _speak(self, engine, text):
+        engine.say(text)
+        engine.runAndWait()
\ No newline at end of file
@@ -1,13 +1,10 @@
 import tkinter as tk
 from tkinter import Toplevel, messagebox, filedialog, Button
 import datetime
+import importlib.util
 
-# Safe import for Pillow
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# Pillow is imported lazily in insert_image; only probe for it here.
+HAS_PIL = importlib.util.find_spec("PIL") is not None
 
 class ToolManager:
     def __init__(self, editor, root):
@@ -46,9 +43,12 @@ class ToolManager:
             return
 
         try:
+            from PIL import Image, ImageTk
             img = Image.open(path)
-            # Resize giant images to prevent UI freeze
-            img.thumbnail((500, 500))
+            # Resize giant images to prevent UI freeze; for JPEGs, draft() lets the
+            # decoder scale down by 1/2..1/8 so the full image is never decoded.
+            img.draft("RGB", (500, 500))
+            img.thumbnail((500, 500), getattr(Image, "Resampling", Image).BOX)
             photo = ImageTk.PhotoImage(img)
 
             self.images.append(photo)  # Keep reference
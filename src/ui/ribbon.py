@@ -4,7 +4,7 @@ from tkinter import ttk, font
 
 class Ribbon(tk.Frame):
     def __init__(self, parent, callbacks, colors):
-        super().__init__(parent, bg=colors["ribbon"], bd=1, relief=tk.RAISED)
+        super().__init__(parent, bg=colors.ribbon, bd=1, relief=tk.RAISED)
         self.pack(side=tk.TOP, fill=tk.X)
         self.callbacks = callbacks
         self.colors = colors
@@ -24,7 +24,7 @@ class Ribbon(tk.Frame):
         """
         self.colors = colors
         try:
-            self.config(bg=colors["ribbon"])
+            self.config(bg=colors.ribbon)
         except tk.TclError:
             pass
 
@@ -38,11 +38,11 @@ class Ribbon(tk.Frame):
             for child in w.winfo_children():
                 # Update common tk widgets
                 if isinstance(child, (tk.Frame, tk.LabelFrame)):
-                    _safe_cfg(child, bg=colors["ribbon"])
+                    _safe_cfg(child, bg=colors.ribbon)
                 elif isinstance(child, tk.Label):
-                    _safe_cfg(child, bg=colors["ribbon"], fg=colors.get("text", "#000"))
+                    _safe_cfg(child, bg=colors.ribbon, fg=colors.text)
                 elif isinstance(child, tk.Button):
-                    _safe_cfg(child, bg=colors["ribbon"], fg=colors.get("text", "#000"))
+                    _safe_cfg(child, bg=colors.ribbon, fg=colors.text)
                 _walk(child)
 
         _walk(self)
@@ -50,13 +50,13 @@ class Ribbon(tk.Frame):
     def _create_group(self, parent, text):
         frame = tk.LabelFrame(
             parent, text=text, padx=5, pady=5,
-            bg=self.colors["ribbon"], font=("Segoe UI", 9)
+            bg=self.colors.ribbon, font=("Segoe UI", 9)
         )
         frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
         return frame
 
     def _init_home(self):
-        tab = tk.Frame(self.notebook, bg=self.colors["ribbon"])
+        tab = tk.Frame(self.notebook, bg=self.colors.ribbon)
         self.notebook.add(tab, text="  Home  ")
 
         g_file = self._create_group(tab, "File")
@@ -70,7 +70,7 @@ class Ribbon(tk.Frame):
         tk.Button(g_edit, text="Select All", command=self.callbacks['select_all']).pack(side=tk.LEFT, padx=2, fill=tk.Y)
 
         g_font = self._create_group(tab, "Font")
-        f_top = tk.Frame(g_font, bg=self.colors["ribbon"])
+        f_top = tk.Frame(g_font, bg=self.colors.ribbon)
         f_top.pack(side=tk.TOP, fill=tk.X)
         self.cb_font = ttk.Combobox(f_top, values=font.families(), width=13, state="readonly")
         self.cb_font.set("Calibri")
@@ -82,7 +82,7 @@ class Ribbon(tk.Frame):
         self.cb_size.pack(side=tk.LEFT, padx=2)
         self.cb_size.bind("<<ComboboxSelected>>", lambda e: self.callbacks['font_size'](self.cb_size.get()))
 
-        f_bot = tk.Frame(g_font, bg=self.colors["ribbon"])
+        f_bot = tk.Frame(g_font, bg=self.colors.ribbon)
         f_bot.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
         tk.Button(f_bot, text="B", font=("Times", 10, "bold"), width=2, command=self.callbacks['bold']).pack(side=tk.LEFT)
         tk.Button(f_bot, text="I", font=("Times", 10, "italic"), width=2, command=self.callbacks['italic']).pack(side=tk.LEFT)
@@ -101,16 +101,16 @@ class Ribbon(tk.Frame):
         tk.Button(g_para, text="• List", command=self.callbacks['list']).pack(side=tk.LEFT, fill=tk.Y, padx=(8, 0))
         tk.Button(g_para, text="1. List", command=self.callbacks['num_list']).pack(side=tk.LEFT, fill=tk.Y)
 
-        f_space = tk.Frame(g_para, bg=self.colors["ribbon"])
+        f_space = tk.Frame(g_para, bg=self.colors.ribbon)
         f_space.pack(side=tk.LEFT, padx=5)
-        tk.Label(f_space, text="Spacing", font=("Arial", 8), bg=self.colors["ribbon"]).pack(side=tk.TOP)
+        tk.Label(f_space, text="Spacing", font=("Arial", 8), bg=self.colors.ribbon).pack(side=tk.TOP)
         self.cb_space = ttk.Combobox(f_space, values=["1.0", "1.5", "2.0"], width=3, state="readonly")
         self.cb_space.set("1.0")
         self.cb_space.pack(side=tk.BOTTOM)
         self.cb_space.bind("<<ComboboxSelected>>", lambda e: self.callbacks['spacing'](float(self.cb_space.get())))
 
     def _init_insert(self):
-        tab = tk.Frame(self.notebook, bg=self.colors["ribbon"])
+        tab = tk.Frame(self.notebook, bg=self.colors.ribbon)
         self.notebook.add(tab, text="  Insert  ")
 
         g_media = self._create_group(tab, "Media")
@@ -125,7 +125,7 @@ class Ribbon(tk.Frame):
         tk.Button(g_tools, text="🔍 Find", command=self.callbacks['find']).pack(side=tk.LEFT, padx=5, fill=tk.Y)
 
     def _init_view(self):
-        tab = tk.Frame(self.notebook, bg=self.colors["ribbon"])
+        tab = tk.Frame(self.notebook, bg=self.colors.ribbon)
         self.notebook.add(tab, text="  View  ")
 
         g_mode = self._create_group(tab, "Window")
@@ -141,7 +141,7 @@ class Ribbon(tk.Frame):
         tk.Button(g_page, text="Paper Color", command=self.callbacks['pg_color']).pack(side=tk.LEFT, padx=2, fill=tk.Y)
 
     def _init_review(self):
-        tab = tk.Frame(self.notebook, bg=self.colors["ribbon"])
+        tab = tk.Frame(self.notebook, bg=self.colors.ribbon)
         self.notebook.add(tab, text="  Review  ")
 
         g_proof = self._create_group(tab, "Proofing")
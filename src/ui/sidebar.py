@@ -5,12 +5,12 @@ from tkinter import ttk
 class Sidebar:
     def __init__(self, parent, app, colors):
         self.app = app
-        self.frame = tk.Frame(parent, bg=colors["sidebar"], width=220)
+        self.frame = tk.Frame(parent, bg=colors.sidebar, width=220)
 
         self.lbl = tk.Label(
             self.frame,
             text=" NAVIGATION ",
-            bg=colors["sidebar"],
+            bg=colors.sidebar,
             font=("Segoe UI", 9, "bold"),
             fg="#555"
         )
@@ -19,9 +19,9 @@ class Sidebar:
         style = ttk.Style()
         style.configure(
             "Sidebar.Treeview",
-            background=colors["paper"],
-            fieldbackground=colors["paper"],
-            foreground=colors["text"],
+            background=colors.paper,
+            fieldbackground=colors.paper,
+            foreground=colors.text,
             borderwidth=0
         )
 
@@ -48,13 +48,13 @@ class Sidebar:
             pass
 
     def update_theme(self, c):
-        self.frame.config(bg=c["sidebar"])
-        self.lbl.config(bg=c["sidebar"], fg=c["text"])
+        self.frame.config(bg=c.sidebar)
+        self.lbl.config(bg=c.sidebar, fg=c.text)
 
         style = ttk.Style()
         style.configure(
             "Sidebar.Treeview",
-            background=c["paper"],
-            fieldbackground=c["paper"],
-            foreground=c["text"]
+            background=c.paper,
+            fieldbackground=c.paper,
+            foreground=c.text
         )
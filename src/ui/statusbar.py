@@ -4,34 +4,44 @@ class StatusBar:
     def __init__(self, parent, app, colors):
         self.app = app
         
-        self.frame = tk.Frame(parent, bg=colors["primary"], height=28)
+        self.frame = tk.Frame(parent, bg=colors.primary, height=28)
         self.frame.pack(side=tk.BOTTOM, fill=tk.X)
         
-        self.lbl = tk.Label(self.frame, text="Ready", bg=colors["primary"], fg="white")
+        self.lbl = tk.Label(self.frame, text="Ready", bg=colors.primary, fg="white")
         self.lbl.pack(side=tk.LEFT, padx=10)
         
         # ZOOM SLIDER
         self.slider = tk.Scale(self.frame, from_=50, to=200, 
                                orient=tk.HORIZONTAL, 
-                               bg=colors["primary"], fg="white", 
+                               bg=colors.primary, fg="white", 
                                highlightthickness=0, showvalue=0,
                                command=self._on_slide)
         self.slider.set(100)
         self.slider.pack(side=tk.RIGHT, padx=10)
+        # Dragging only previews; the settled value is applied and saved on release.
+        self.slider.bind("<ButtonRelease-1>", self._on_slide_done)
+        self.slider.bind("<KeyRelease>", self._on_slide_done)
         
-        self.zoom_lbl = tk.Label(self.frame, text="100%", bg=colors["primary"], fg="white")
+        self.zoom_lbl = tk.Label(self.frame, text="100%", bg=colors.primary, fg="white")
         self.zoom_lbl.pack(side=tk.RIGHT)
 
     def _on_slide(self, val):
+        # slider.set() in update_zoom_label re-fires this (from idle, so a flag
+        # can't catch it); a value already applied needs no second pass.
+        if int(val) == self.app.formatter.zoom_level:
+            return
         # Pass ABSOLUTE value to app
-        self.app.update_zoom(absolute=int(val))
+        self.app.update_zoom(absolute=int(val), persist=False)
+
+    def _on_slide_done(self, _evt=None):
+        self.app.update_zoom(absolute=int(self.slider.get()))
 
     def update_zoom_label(self, val):
         self.zoom_lbl.config(text=f"{val}%")
         self.slider.set(val)
 
     def update_theme(self, c):
-        self.frame.config(bg=c["primary"])
-        self.lbl.config(bg=c["primary"])
-        self.slider.config(bg=c["primary"])
-        self.zoom_lbl.config(bg=c["primary"])
\ No newline at end of file
+        self.frame.config(bg=c.primary)
+        self.lbl.config(bg=c.primary)
+        self.slider.config(bg=c.primary)
+        self.zoom_lbl.config(bg=c.primary)
\ No newline at end of file
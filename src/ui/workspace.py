@@ -2,11 +2,11 @@ import tkinter as tk
 
 class Workspace(tk.Frame):
     def __init__(self, parent, colors, initial_zoom=100):
-        super().__init__(parent, bg=colors["bg"])
+        super().__init__(parent, bg=colors.bg)
         self.pack(fill=tk.BOTH, expand=True)
 
         # 1. Desk Frame (The gray background area)
-        self.desk_frame = tk.Frame(self, bg=colors["bg"])
+        self.desk_frame = tk.Frame(self, bg=colors.bg)
         self.desk_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
         
         # Grid layout for scrollbars
@@ -27,9 +27,9 @@ class Workspace(tk.Frame):
         # 4. Text Editor (The Paper)
         self.text_area = tk.Text(self.page_container, 
                                  font=("Calibri", 11),
-                                 bg=colors["paper"], 
-                                 fg=colors["text"],
-                                 insertbackground=colors["text"],
+                                 bg=colors.paper, 
+                                 fg=colors.text,
+                                 insertbackground=colors.text,
                                  wrap=tk.WORD,
                                  padx=50, pady=50,
                                  spacing1=2, spacing2=2,
@@ -51,10 +51,10 @@ class Workspace(tk.Frame):
         return self.text_area
 
     def update_theme(self, colors):
-        self.config(bg=colors["bg"])
-        self.desk_frame.config(bg=colors["bg"])
+        self.config(bg=colors.bg)
+        self.desk_frame.config(bg=colors.bg)
         self.text_area.config(
-            bg=colors["paper"], 
-            fg=colors["text"], 
-            insertbackground=colors["text"]
+            bg=colors.paper, 
+            fg=colors.text, 
+            insertbackground=colors.text
         )
\ No newline at end of file